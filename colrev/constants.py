@@ -589,7 +589,7 @@ class ShareStatReq(Enum):
 
 
 # pylint: disable=colrev-missed-constant-usage
-class EndpointType(Enum):
+class EndpointType(str, Enum):
     """An enum for the types of PackageEndpoints"""
 
     # pylint: disable=C0103
@@ -292,13 +292,16 @@ class Dataset:
         # Note : matches conditions connected with 'OR'
         records = self.load_records_dict()
 
-        records_list = []
-        for _, record in records.items():
-            for condition in conditions:
-                for key, value in condition.items():
-                    if str(value) == str(record[key]):
-                        records_list.append(record)
-        yield from records_list
+        # Note: records are yielded directly (without collecting them in a list).
+        # Each record is checked (and yielded) once, before the consumer can
+        # change it (e.g., set a status that matches another condition).
+        for record in records.values():
+            if any(
+                str(value) == str(record[key])
+                for condition in conditions
+                for key, value in condition.items()
+            ):
+                yield record
 
     def format_records_file(self) -> dict:
         """Format the records file (Entrypoint for pre-commit hooks)"""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import typing
+from functools import lru_cache
 from pathlib import Path
 
 import docker
@@ -11,6 +12,16 @@ from docker.errors import DockerException
 import colrev.exceptions as colrev_exceptions
 from colrev.constants import Colors
 
+# Images that are known to be available (listed, built or pulled in this process)
+_AVAILABLE_IMAGES: typing.Set[str] = set()
+
+
+@lru_cache(maxsize=1)
+def _get_docker_client() -> docker.DockerClient:
+    # Note: the client (connection settings for the daemon) is created once
+    # (DockerExceptions are not cached)
+    return docker.from_env()
+
 
 class DockerManager:
     """The DockerManager manages everything related to Docker
@@ -22,8 +33,10 @@ class DockerManager:
     ) -> None:
         """Build a docker image"""
 
+        if imagename in _AVAILABLE_IMAGES:
+            return
         try:
-            client = docker.from_env()
+            client = cls.get_client()
             repo_tags = [t for image in client.images.list() for t in image.tags]
 
             if imagename not in repo_tags:
@@ -38,6 +51,7 @@ class DockerManager:
                 else:
                     print(f"Pulling {imagename} Docker image...")
                     client.images.pull(imagename)
+            _AVAILABLE_IMAGES.add(imagename)
         except DockerException as exc:  # pragma: no cover
             raise colrev_exceptions.ServiceNotAvailableException(
                 dep="docker",
@@ -45,12 +59,17 @@ class DockerManager:
                 + "Please install/start Docker.",
             ) from exc
 
+    @classmethod
+    def get_client(cls) -> docker.DockerClient:
+        """Get the (shared) Docker client"""
+        return _get_docker_client()
+
     @classmethod
     def check_docker_installed(cls) -> None:  # pragma: no cover
         """Check whether Docker is installed"""
 
         try:
-            client = docker.from_env()
+            client = cls.get_client()
             _ = client.version()
         except docker.errors.DockerException as exc:
             if "PermissionError" in exc.args[0]:
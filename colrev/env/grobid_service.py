@@ -18,6 +18,10 @@ class GrobidService:
 
     GROBID_URL = "http://localhost:8070"
     GROBID_IMAGE = "lfoppiano/grobid:0.8.0"
+    # Successful availability checks are reused for a short time
+    # (shared by all instances, e.g., when several md files are loaded)
+    _AVAILABILITY_TTL = 30
+    _available_until = 0.0
 
     def __init__(
         self,
@@ -34,6 +38,8 @@ class GrobidService:
 
     def check_grobid_availability(self, *, wait: bool = True) -> bool:
         """Check whether the GROBID service is available"""
+        if time.monotonic() < GrobidService._available_until:
+            return True
         i = 0
         while True:
             i += 1
@@ -41,6 +47,9 @@ class GrobidService:
             try:
                 ret = requests.get(self.GROBID_URL + "/api/isalive", timeout=30)
                 if ret.text == "true":
+                    GrobidService._available_until = (
+                        time.monotonic() + self._AVAILABILITY_TTL
+                    )
                     return True
             except requests.exceptions.ConnectionError:
                 pass
@@ -25,6 +25,7 @@ import colrev.exceptions as colrev_exceptions
 import colrev.loader.load_utils
 import colrev.ops.check
 import colrev.record.record
+import colrev.record.record_identifier
 import colrev.review_manager
 from colrev.constants import Colors
 from colrev.constants import ENTRYTYPES
@@ -89,7 +90,9 @@ class LocalIndexBuilder:
         ]:
             return
 
-        toc_item = colrev.record.record.Record(copy_for_toc_index).get_toc_key()
+        toc_item = colrev.record.record_identifier.get_toc_key_from_dict(
+            copy_for_toc_index
+        )
         # Note : drop (do not index) tocs where records are missing
         # otherwise, record-not-in-toc will be triggered erroneously.
         drop_toc = copy_for_toc_index[
@@ -6,35 +6,55 @@ import re
 import typing
 import unicodedata
 from enum import Enum
+from functools import lru_cache
 from functools import reduce
 from pathlib import Path
 
+import openpyxl
+import pandas as pd
 from jinja2 import Environment
 from jinja2 import FunctionLoader
 from jinja2.environment import Template
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 
 import colrev.exceptions as colrev_exceptions
 
 
+@lru_cache(maxsize=None)
+def _get_package_file_text(template_file: str) -> typing.Optional[str]:
+    # Note: package files are static (loaded and decoded once per process)
+    filedata = pkgutil.get_data("colrev", template_file)
+    if not filedata:
+        return None
+    return filedata.decode("utf-8")
+
+
 def retrieve_package_file(*, template_file: Path, target: Path) -> None:
     """Retrieve a file from the CoLRev package"""
     try:
-        filedata = pkgutil.get_data("colrev", str(template_file))
-        if filedata:
+        filetext = _get_package_file_text(str(template_file))
+        if filetext:
             target.parent.mkdir(exist_ok=True, parents=True)
             with open(target, "w", encoding="utf8") as file:
-                file.write(filedata.decode("utf-8"))
+                file.write(filetext)
             return
     except FileNotFoundError:
         pass
     raise colrev_exceptions.TemplateNotAvailableError(str(template_file))
 
 
+@lru_cache(maxsize=32)
+def _get_package_data(module: str, filename: str) -> typing.Union[bytes, None]:
+    # Note: package files are static and bytes are immutable (safe to share)
+    return pkgutil.get_data(module, filename)
+
+
 def get_package_file_content(
     *, module: str, filename: Path
 ) -> typing.Union[bytes, None]:
     """Get the content of a file in the CoLRev package"""
-    return pkgutil.get_data(module, str(filename))
+    return _get_package_data(module, str(filename))
 
 
 def inplace_change(*, filename: Path, old_string: str, new_string: str) -> None:
@@ -48,6 +68,23 @@ def inplace_change(*, filename: Path, old_string: str, new_string: str) -> None:
         file.write(content)
 
 
+def inplace_change_multiple(*, filename: Path, replacements: dict) -> None:
+    """Replace multiple strings in a file (reading and writing the file once)"""
+    if not replacements:
+        return
+    with open(filename, encoding="utf8") as file:
+        content = file.read()
+    # Note: the strings are replaced in one pass (longer strings first)
+    pattern = re.compile(
+        "|".join(re.escape(o) for o in sorted(replacements, key=len, reverse=True))
+    )
+    new_content = pattern.sub(lambda match: replacements[match.group(0)], content)
+    if new_content == content:
+        return
+    with open(filename, "w", encoding="utf8") as file:
+        file.write(new_content)
+
+
 def get_template(template_path: str) -> Template:
     """Load a jinja template"""
     environment = Environment(
@@ -88,25 +125,27 @@ def percent_upper_chars(input_string: str) -> float:
     return sum(map(str.isupper, input_string)) / len(input_string)
 
 
+def _convert_value(obj: object) -> object:
+    # Only Enums, Paths (and lists of Paths) are replaced
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, float):
+        # Save 1.0 as 1 per default to avoid parsing issues
+        # e.g., with the web ui
+        if obj == 1.0:  # pragma: no cover
+            return 1
+    if isinstance(obj, list):
+        if all(isinstance(el, Path) for el in obj):
+            return [str(el) for el in obj]
+    return obj
+
+
 def custom_asdict_factory(data) -> dict:  # type: ignore
     """Custom asdict factory for (dataclass)object-to-dict conversion"""
 
-    def convert_value(obj: object) -> object:
-        if isinstance(obj, Enum):
-            return obj.value
-        if isinstance(obj, Path):
-            return str(obj)
-        if isinstance(obj, float):
-            # Save 1.0 as 1 per default to avoid parsing issues
-            # e.g., with the web ui
-            if str(obj) == "1.0":  # pragma: no cover
-                return 1
-        if isinstance(obj, list):
-            if all(isinstance(el, Path) for el in obj):
-                return [str(el) for el in obj]
-        return obj
-
-    return {k: convert_value(v) for k, v in data}
+    return {k: _convert_value(v) for k, v in data}
 
 
 def load_complementary_material_keywords() -> list:
@@ -158,3 +197,33 @@ def dict_set_nested(root: dict, keys: typing.List[str], value: typing.Any) -> No
     for key in keys[:-1]:
         root = root.setdefault(key, {})
     root[keys[-1]] = value
+
+
+def _to_cell_value(value: typing.Any) -> typing.Any:
+    # Note: like pandas.to_excel(): missing values are empty,
+    # numbers are kept and other values (e.g., RecordStates) are converted to str
+    if pd.isna(value):
+        return None
+    if pd.api.types.is_integer(value):
+        return int(value)
+    if pd.api.types.is_float(value):
+        return float(value)
+    return str(value)
+
+
+def save_df_to_xlsx(
+    *, data_frame: pd.DataFrame, path: Path, sheet_name: str = "Sheet1"
+) -> None:
+    """Save a DataFrame to an xlsx file (streaming the rows)"""
+    # Note: the default to_excel() keeps all cells of the workbook in memory
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet(sheet_name)
+    header = []
+    for column in data_frame.columns:
+        cell = WriteOnlyCell(worksheet, value=column)
+        cell.font = Font(bold=True)
+        header.append(cell)
+    worksheet.append(header)
+    for row in data_frame.itertuples(index=False, name=None):
+        worksheet.append([_to_cell_value(value) for value in row])
+    workbook.save(path)
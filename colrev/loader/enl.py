@@ -2,9 +2,10 @@
 """Convenience functions to load ENL files"""
 from __future__ import annotations
 
+import itertools
 import logging
-import re
 import typing
+from collections import defaultdict
 from pathlib import Path
 
 import colrev.loader.loader
@@ -25,8 +26,6 @@ class ParseError(Exception):
 class ENLLoader(colrev.loader.loader.Loader):
     """Loads enl files"""
 
-    PATTERN = r"^%[A-Z]{1,3} "
-
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -48,16 +47,15 @@ class ENLLoader(colrev.loader.loader.Loader):
             logger=logger,
         )
 
-        self.current: dict = {}
-        self.pattern = re.compile(self.PATTERN)
+        self.current: typing.DefaultDict[str, list] = defaultdict(list)
 
     @classmethod
     def get_nr_records(cls, filename: Path) -> int:
         """Get the number of records in the file"""
         count = 0
-        with open(filename, encoding="utf-8") as file:
+        with open(filename, "rb") as file:
             for line in file:
-                if line.startswith("%T"):
+                if line.startswith(b"%T"):
                     count += 1
         return count
 
@@ -69,30 +67,33 @@ class ENLLoader(colrev.loader.loader.Loader):
         """Get the content from a line"""
         return line[2:].strip()
 
-    def _add_tag(self, tag: str, line: str) -> None:
-        new_value = self._get_content(line)
-
-        if tag not in self.current:
-            self.current[tag] = new_value
-        elif isinstance(self.current[tag], str):
-            self.current[tag] = [self.current[tag], new_value]
-        elif isinstance(self.current[tag], list):
-            self.current[tag].append(new_value)
-
-    def _parse_tag(self, line: str) -> dict:
-        tag = self._get_tag(line)
+    def _add_tag(self, tag: str, content: str) -> None:
+        self.current[tag].append(content)
 
+    def _parse_tag(self, tag: str, content: str) -> dict:
         if tag.strip() == "":
-            return self.current
+            # Note: values are accumulated in lists and
+            # single values are unpacked once per record
+            return {k: v[0] if len(v) == 1 else v for k, v in self.current.items()}
 
-        self._add_tag(tag, line)
+        self._add_tag(tag, content)
         raise NextLine
 
-    def _parse_lines(self, lines: list) -> typing.Iterator[dict]:
+    def _split_line(self, line: bytes) -> typing.Tuple[str, str]:
+        """Split a (binary) line into tag and content"""
+        raw_tag = line[1:3]
+        if raw_tag.isascii():
+            # Note: if bytes 1-2 are ASCII, byte 0 is a single-byte character.
+            # The tag is decoded directly and only the content is decoded (once).
+            return raw_tag.decode("ascii").rstrip(), line[2:].decode("utf-8").strip()
+        decoded_line = line.decode("utf-8")
+        return self._get_tag(decoded_line), self._get_content(decoded_line)
+
+    def _parse_lines(self, lines: typing.Iterable[bytes]) -> typing.Iterator[dict]:
         for line in lines:
             try:
-                yield self._parse_tag(line)
-                self.current = {}
+                yield self._parse_tag(*self._split_line(line))
+                self.current = defaultdict(list)
             except NextLine:
                 continue
 
@@ -104,8 +105,9 @@ class ENLLoader(colrev.loader.loader.Loader):
         # Note: skip-tags and unknown-tags can be handled
         # between load_enl_entries and convert_to_records.
 
-        text = self.filename.read_text(encoding="utf-8")
-        # clean_text?
-        lines = text.split("\n")
-        records_list = list(r for r in self._parse_lines(lines) if r)
+        # Note: lines are streamed from the file (instead of read_text and split).
+        # The final empty line ensures that the last record is completed.
+        with open(self.filename, "rb") as file:
+            lines = itertools.chain(file, [b""])
+            records_list = list(r for r in self._parse_lines(lines) if r)
         return records_list
@@ -53,6 +53,15 @@ class MarkdownLoader(colrev.loader.loader.Loader):
                     count += 1
         return count
 
+    @staticmethod
+    def _is_comment_line(line: bytes) -> bool:
+        # Note: lines with a "#" in the first two characters are skipped.
+        # If the first byte is ASCII, the second character starts at byte 1,
+        # i.e., the check does not require decoding the line.
+        if line[:1].isascii():
+            return line.find(b"#", 0, 2) != -1
+        return line.decode("utf8").find("#", 0, 2) != -1
+
     def load_records_list(self) -> list:
         """Load records from the source"""
 
@@ -61,23 +70,28 @@ class MarkdownLoader(colrev.loader.loader.Loader):
         grobid_service = colrev.env.grobid_service.GrobidService()
 
         grobid_service.check_grobid_availability()
-        with open(self.filename, encoding="utf8") as file:
-            references = [line.rstrip() for line in file if "#" not in line[:2]]
-
-        data = ""
-        ind = 0
-        for ref in references:
-            options = {}
-            options["consolidateCitations"] = "0"
-            options["citations"] = ref
-            ret = requests.post(
-                grobid_service.GROBID_URL + "/api/processCitation",
-                data=options,
-                headers={"Accept": "application/x-bibtex"},
-                timeout=30,
-            )
-            ind += 1
-            data = data + "\n" + ret.text.replace("{-1,", "{" + str(ind) + ",")
+        with open(self.filename, "rb") as file:
+            references = [
+                line.decode("utf8").rstrip()
+                for line in file
+                if not self._is_comment_line(line)
+            ]
+
+        # Note: the session keeps the connection to GROBID alive across references
+        bib_entries = [""]
+        with requests.Session() as session:
+            for ind, ref in enumerate(references, start=1):
+                options = {}
+                options["consolidateCitations"] = "0"
+                options["citations"] = ref
+                ret = session.post(
+                    grobid_service.GROBID_URL + "/api/processCitation",
+                    data=options,
+                    headers={"Accept": "application/x-bibtex"},
+                    timeout=30,
+                )
+                bib_entries.append(ret.text.replace("{-1,", "{" + str(ind) + ","))
+        data = "\n".join(bib_entries)
 
         records_dict = colrev.loader.load_utils.loads(
             load_string=data,
@@ -2,10 +2,12 @@
 """Convenience functions to load tabular files (csv, xlsx)"""
 from __future__ import annotations
 
+import itertools
 import logging
 import typing
 from pathlib import Path
 
+import openpyxl
 import pandas as pd
 
 import colrev.exceptions as colrev_exceptions
@@ -42,17 +44,73 @@ class TableLoader(colrev.loader.loader.Loader):
     def get_nr_records(cls, filename: Path) -> int:
         """Get the number of records in the file"""
         if filename.name.endswith(".csv"):
-            data = pd.read_csv(filename)
+            # Only the first column is converted (sufficient to count the rows)
+            data = pd.read_csv(filename, usecols=[0])
         elif filename.name.endswith((".xls", ".xlsx")):
             data = pd.read_excel(filename, dtype=str)
         count = len(data)
         return count
 
+    @staticmethod
+    def _convert_xlsx_value(value: typing.Any) -> typing.Any:
+        # Note: mirrors pd.read_excel(dtype=str) (empty cells are nan)
+        if value is None or value == "":
+            return float("nan")
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value)
+
+    def _load_xlsx_records_list(self) -> typing.Optional[list]:
+        """Load the records from the first worksheet (streaming, without a DataFrame)
+
+        Returns None if the table requires pandas' handling
+        (missing or duplicate column names, values outside the header columns)."""
+        workbook = openpyxl.load_workbook(self.filename, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return []
+            while header and header[-1] in (None, ""):
+                header = header[:-1]
+            if (
+                not header
+                or not all(isinstance(column, str) and column for column in header)
+                or len(set(header)) != len(header)
+            ):
+                return None
+            records_list = []
+            nr_non_blank_records = 0
+            for row in rows:
+                if any(v not in (None, "") for v in row[len(header) :]):
+                    return None
+                records_list.append(
+                    {
+                        column: self._convert_xlsx_value(value)
+                        for column, value in itertools.zip_longest(
+                            header, row[: len(header)]
+                        )
+                    }
+                )
+                if any(v not in (None, "") for v in row):
+                    nr_non_blank_records = len(records_list)
+            # Trailing blank rows are dropped (as in pandas)
+            return records_list[:nr_non_blank_records]
+        finally:
+            workbook.close()
+
     def load_records_list(self) -> list:
         try:
             if self.filename.name.endswith(".csv"):
                 data = pd.read_csv(self.filename)
-            elif self.filename.name.endswith((".xls", ".xlsx")):
+            elif self.filename.name.endswith(".xlsx"):
+                xlsx_records_list = self._load_xlsx_records_list()
+                if xlsx_records_list is not None:
+                    return xlsx_records_list
+                data = pd.read_excel(
+                    self.filename, dtype=str
+                )  # dtype=str to avoid type casting
+            elif self.filename.name.endswith(".xls"):
                 data = pd.read_excel(
                     self.filename, dtype=str
                 )  # dtype=str to avoid type casting
@@ -45,12 +45,13 @@ class CustomScreen:
 
         screening_criteria_available = bool(screening_criteria)
 
+        # Note: the decisions are set in records and saved together
         for record_dict in screen_data["items"]:
             if len(split) > 0:
                 if record_dict[Fields.ID] not in split:
                     continue
 
-            record = colrev.record.record.Record(record_dict)
+            record = colrev.record.record.Record(records[record_dict[Fields.ID]])
 
             if random.random() < 0.5:  # nosec
                 if screening_criteria_available:
@@ -60,6 +61,7 @@ class CustomScreen:
                     record=record,
                     screen_inclusion=True,
                     screening_criteria="...",
+                    save=False,
                 )
 
             else:
@@ -70,10 +72,10 @@ class CustomScreen:
                     record=record,
                     screen_inclusion=False,
                     screening_criteria="...",
+                    save=False,
                 )
 
         screen_operation.review_manager.dataset.save_records_dict(records)
-        screen_operation.review_manager.dataset.add_record_changes()
         screen_operation.review_manager.dataset.create_commit(
             msg="Screen (random)", manual_author=False, script_call="colrev screen"
         )
@@ -7,11 +7,12 @@ import logging
 import os
 import platform
 import shutil
+from copy import deepcopy
+from functools import lru_cache
 from importlib.metadata import version
 from pathlib import Path
-from subprocess import CalledProcessError  # nosec
-from subprocess import check_call  # nosec
 from subprocess import DEVNULL  # nosec
+from subprocess import Popen  # nosec
 from subprocess import STDOUT  # nosec
 
 import git
@@ -27,10 +28,35 @@ import colrev.settings
 from colrev.constants import Colors
 from colrev.constants import EndpointType
 from colrev.constants import Fields
+from colrev.constants import SearchType
 
 # pylint: disable=too-few-public-methods
 
 
+# Endpoints that require Docker (removed when initializing with --light)
+_DOCKER_ENDPOINTS = frozenset(
+    {
+        "colrev.paper_md",
+        "colrev.files_dir",
+        "colrev.ocrmypdf",
+        "colrev.remove_coverpage",
+        "colrev.remove_last_page",
+        "colrev.grobid_tei",
+    }
+)
+
+
+@lru_cache(maxsize=1)
+def _load_settings_template() -> dict:
+    # Note: parse instead of copy to avoid format changes
+    settings_filedata = colrev.env.utils.get_package_file_content(
+        module="colrev.ops", filename=Path("init/settings.json")
+    )
+    if not settings_filedata:  # pragma: no cover
+        return {}
+    return json.loads(settings_filedata)
+
+
 class Initializer:
     """Initialize a CoLRev project"""
 
@@ -136,21 +162,29 @@ class Initializer:
         except (InvalidGitRepositoryError, ValueError):
             pass
 
+    def _get_top_level_content(self) -> list:
+        # Note: nested paths share the prefix of their top-level entry.
+        # It is therefore sufficient to scan the top-level (no recursive glob).
+        report_file = str(self.review_manager.paths.REPORT_FILE)
+        cur_content = []
+        with os.scandir(self.target_path) as entries:
+            for entry in entries:
+                if entry.name.startswith("venv") or entry.name == report_file:
+                    continue
+                if entry.name == ".history":
+                    # Only the .history directory itself is ignored (not its content)
+                    if entry.is_dir():
+                        with os.scandir(entry.path) as history_entries:
+                            if any(True for _ in history_entries):
+                                cur_content.append(entry.name)
+                    continue
+                cur_content.append(entry.name)
+        return cur_content
+
     def _check_init_precondition(self) -> None:
         if self.force_mode:
             return
-        cur_content = [
-            str(x.relative_to(self.target_path)) for x in self.target_path.glob("**/*")
-        ]
-        cur_content = [
-            x for x in cur_content if not x.startswith("venv") and x != ".history"
-        ]
-        if str(self.review_manager.paths.REPORT_FILE) in cur_content:
-            cur_content.remove(str(self.review_manager.paths.REPORT_FILE))
-
-        if all(x.startswith((".git", ".devcontainer", ".vscode")) for x in cur_content):
-            return
-
+        cur_content = self._get_top_level_content()
         if all(x.startswith((".git", ".devcontainer", ".vscode")) for x in cur_content):
             return
 
@@ -159,8 +193,7 @@ class Initializer:
                 filepath=self.target_path, content=cur_content
             )
 
-        environment_manager = colrev.env.environment_manager.EnvironmentManager()
-        environment_manager.get_name_mail_from_git()
+        colrev.env.environment_manager.EnvironmentManager.get_name_mail_from_git()
 
         try:
             colrev.env.docker_manager.DockerManager.check_docker_installed()
@@ -180,8 +213,8 @@ class Initializer:
         git.Repo.init()
 
         # To check if git actors are set
-        environment_manager = colrev.env.environment_manager.EnvironmentManager()
-        environment_manager.get_name_mail_from_git()
+        # Note: classmethod (no need to load the environment registry)
+        colrev.env.environment_manager.EnvironmentManager.get_name_mail_from_git()
 
         logging.info("Install latest pre-commmit hooks")
         scripts_to_call = [
@@ -204,25 +237,32 @@ class Initializer:
             },
             {"description": "", "command": ["pre-commit", "autoupdate"]},
         ]
-        for script_to_call in scripts_to_call:
-            try:
-                if script_to_call["description"]:
-                    self.review_manager.logger.debug(
-                        "%s...", script_to_call["description"]
-                    )
-                check_call(
-                    script_to_call["command"], stdout=DEVNULL, stderr=STDOUT
-                )  # nosec
-            except CalledProcessError:
-                if " ".join(script_to_call["command"]) == "pre-commit autoupdate":
-                    pass
-                else:
-                    self.review_manager.logger.error(
-                        "%sFailed: %s%s",
-                        Colors.RED,
-                        " ".join(script_to_call),
-                        Colors.END,
-                    )
+        # Note: "pre-commit install" (without --hook-type) reads the config,
+        # which is rewritten by "pre-commit autoupdate". The other commands
+        # are independent and run in parallel (autoupdate requires network access).
+        # pylint: disable=consider-using-with
+        running_scripts = []
+        for i, script_to_call in enumerate(scripts_to_call):
+            if script_to_call["description"]:
+                self.review_manager.logger.debug("%s...", script_to_call["description"])
+            process = Popen(
+                script_to_call["command"], stdout=DEVNULL, stderr=STDOUT
+            )  # nosec
+            if i == 0:
+                process.wait()
+            running_scripts.append((script_to_call, process))
+
+        for script_to_call, process in running_scripts:
+            if process.wait() == 0:
+                continue
+            if " ".join(script_to_call["command"]) == "pre-commit autoupdate":
+                continue
+            self.review_manager.logger.error(
+                "%sFailed: %s%s",
+                Colors.RED,
+                " ".join(script_to_call["command"]),
+                Colors.END,
+            )
 
     def _fix_pre_commit_hooks_windows(self) -> None:
         # https://stackoverflow.com/questions/12410164/github-for-windows-pre-commit-hook
@@ -237,12 +277,9 @@ class Initializer:
 
     def _setup_files(self) -> None:
 
-        # Note: parse instead of copy to avoid format changes
-        settings_filedata = colrev.env.utils.get_package_file_content(
-            module="colrev.ops", filename=Path("init/settings.json")
-        )
-        if settings_filedata:
-            settings = json.loads(settings_filedata.decode("utf-8"))
+        # Note: the template is parsed once (copied to keep the cached dict unchanged)
+        settings = deepcopy(_load_settings_template())
+        if settings:
             settings["project"]["review_type"] = str(self.review_type)
             with open(self.review_manager.paths.settings, "w", encoding="utf8") as file:
                 json.dump(settings, file, indent=4)
@@ -321,46 +358,32 @@ class Initializer:
         )
 
         settings = review_type_object.initialize(settings=settings)
-        self.review_manager.save_settings()
 
         project_title = self.review_manager.settings.project.title
-        if "review" in project_title.lower():
-            colrev.env.utils.inplace_change(
-                filename=Path("readme.md"),
-                old_string="{{project_title}}",
-                new_string=project_title.rstrip(" ").capitalize(),
-            )
-        else:
-            package_manager = self.review_manager.get_package_manager()
-            r_type_suffix = str(review_type_object)
-
-            colrev.env.utils.inplace_change(
-                filename=Path("readme.md"),
-                old_string="{{project_title}}",
-                new_string=project_title.rstrip(" ").capitalize()
-                + f": A {r_type_suffix} protocol",
-            )
+        readme_title = project_title.rstrip(" ").capitalize()
+        if "review" not in project_title.lower():
+            readme_title += f": A {review_type_object} protocol"
+        # Note: the readme.md is rewritten once (single read/write)
+        colrev.env.utils.inplace_change(
+            filename=Path("readme.md"),
+            old_string="{{project_title}}",
+            new_string=readme_title,
+        )
 
         if self.no_docker:
             settings.data.data_package_endpoints = [
                 x
                 for x in settings.data.data_package_endpoints
-                if x["endpoint"] not in ["colrev.paper_md"]
+                if x["endpoint"] not in _DOCKER_ENDPOINTS
             ]
             settings.sources = [
-                x for x in settings.sources if x.endpoint not in ["colrev.files_dir"]
+                x for x in settings.sources if x.endpoint not in _DOCKER_ENDPOINTS
             ]
 
             settings.pdf_prep.pdf_prep_package_endpoints = [
                 x
                 for x in settings.pdf_prep.pdf_prep_package_endpoints
-                if x["endpoint"]
-                not in [
-                    "colrev.ocrmypdf",
-                    "colrev.remove_coverpage",
-                    "colrev.remove_last_page",
-                    "colrev.grobid_tei",
-                ]
+                if x["endpoint"] not in _DOCKER_ENDPOINTS
             ]
 
         self.review_manager.save_settings()
@@ -458,22 +481,18 @@ class Initializer:
         git_repo = self.review_manager.dataset.get_repo()
         git_repo.index.add(["data/search/30_example_records.bib"])
 
-        with open(self.review_manager.paths.settings, encoding="utf-8") as file:
-            settings = json.load(file)
-
-        settings["dedupe"]["dedupe_package_endpoints"] = [{"endpoint": "colrev.dedupe"}]
-        settings["sources"] = [
-            {
-                "endpoint": "colrev.unknown_source",
-                "filename": str(Path("data/search/30_example_records.bib")),
-                "search_type": "DB",
-                "search_parameters": {
+        # Note: the settings are up-to-date in memory (no need to re-read the file)
+        settings = self.review_manager.settings
+        settings.dedupe.dedupe_package_endpoints = [{"endpoint": "colrev.dedupe"}]
+        settings.sources = [
+            colrev.settings.SearchSource(
+                endpoint="colrev.unknown_source",
+                filename=Path("data/search/30_example_records.bib"),
+                search_type=SearchType.DB,
+                search_parameters={
                     "query_file": str(Path("data/search/30_example_records_query.txt"))
                 },
-                "comment": "",
-            }
+                comment="",
+            )
         ]
-
-        with open(self.review_manager.paths.settings, "w", encoding="utf-8") as outfile:
-            json.dump(settings, outfile, indent=4)
-        git_repo.index.add([self.review_manager.paths.SETTINGS_FILE])
+        self.review_manager.save_settings()
@@ -98,7 +98,7 @@ class Merge(colrev.process.operation.Operation):
         branches = git_repo.heads
         assert branch in [b.name for b in branches]
 
-        git_branch = [b for b in branches if b.name == branch][0]
+        git_branch = next(b for b in branches if b.name == branch)
         merging_branch_author = git_branch.commit.author
         current_branch = git_repo.active_branch.name
 
@@ -2,15 +2,21 @@
 """CoLRev pdf_get operation: Get PDF documents."""
 from __future__ import annotations
 
+import json
+import multiprocessing as mp
+import os
 import shutil
+import threading
 import typing
-from glob import glob
 from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
 
 import colrev.exceptions as colrev_exceptions
 import colrev.process.operation
+import colrev.record.record
+import colrev.record.record_identifier
 import colrev.record.record_pdf
+import colrev.record.record_similarity
 from colrev.constants import Colors
 from colrev.constants import EndpointType
 from colrev.constants import Fields
@@ -19,6 +25,52 @@ from colrev.constants import PDFPathType
 from colrev.constants import RecordState
 from colrev.writer.write_utils import write_file
 
+# Records in these states are retrieved
+# Note: a tuple (identity comparisons) is faster than hashing the Enum (Python-level)
+_PDF_GET_STATES = (
+    RecordState.rev_prescreen_included,
+    RecordState.pdf_needs_manual_retrieval,
+)
+
+# colrev_pdf_ids of the PDFs (reused if the mtime and size of a file do not change)
+_CPID_CACHE_FILE = Path(".colrev/cpid_cache.json")
+
+
+def _scandir_pdfs(directory: Path) -> typing.Iterator[Path]:
+    """Recursively yield the PDFs in the directory (like directory.glob("**/*.pdf"))"""
+    # Note: scandir provides the file type without an additional stat per entry
+    # Symlinked directories are not followed (as in Path.glob)
+    sub_directories = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".pdf"):
+                yield Path(entry.path)
+            if entry.is_dir(follow_symlinks=False):
+                sub_directories.append(entry.path)
+    for sub_directory in sub_directories:
+        yield from _scandir_pdfs(Path(sub_directory))
+
+
+def _get_top_level_pdfs(directory: Path) -> typing.List[str]:
+    """Get the (non-hidden) PDFs in the directory (like glob(dir + "/**.pdf"))"""
+    # Note: "**.pdf" is not a recursive pattern (only the top level is checked)
+    with os.scandir(directory) as entries:
+        return [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".pdf") and not entry.name.startswith(".")
+        ]
+
+
+def _get_colrev_pdf_id_in_worker(pdf_path: Path) -> str:
+    """Get the colrev_pdf_id (empty if hashing fails)"""
+    # Note: errors are raised in the main process (by hashing the PDF again)
+    # because CoLRev exceptions are not restored correctly when unpickled
+    try:
+        return colrev.record.record_identifier.get_colrev_pdf_id(pdf_path)
+    except colrev_exceptions.CoLRevException:
+        return ""
+
 
 class PDFGet(colrev.process.operation.Operation):
     """Get the PDFs"""
@@ -47,6 +99,8 @@ class PDFGet(colrev.process.operation.Operation):
         pdf_dir.mkdir(exist_ok=True, parents=True)
 
         self.pdf_qm = self.review_manager.get_pdf_qm()
+        # Endpoints are instantiated once per (pool) thread and reused for all records
+        self._thread_local = threading.local()
 
         self.filepath_directory_pattern = ""
         pdf_endpoints = [
@@ -171,16 +225,33 @@ class PDFGet(colrev.process.operation.Operation):
                 + f"rev_prescreen_included → pdf_needs_manual_preparation{Colors.END}"
             )
 
+    def _get_endpoints(self) -> list:
+        endpoints = getattr(self._thread_local, "endpoints", None)
+        if endpoints is not None:
+            return endpoints
+
+        endpoints = []
+        for (
+            pdf_get_package_endpoint
+        ) in self.review_manager.settings.pdf_get.pdf_get_package_endpoints:
+
+            pdf_get_class = self.package_manager.get_package_endpoint_class(
+                package_type=EndpointType.pdf_get,
+                package_identifier=pdf_get_package_endpoint["endpoint"],
+            )
+            endpoints.append(
+                pdf_get_class(pdf_get_operation=self, settings=pdf_get_package_endpoint)
+            )
+        self._thread_local.endpoints = endpoints
+        return endpoints
+
     # Note : no named arguments (multiprocessing)
     def get_pdf(self, item: dict) -> dict:
         """Get PDFs (based on the package endpoints in the settings)"""
 
         record_dict = item["record"]
 
-        if record_dict[Fields.STATUS] not in [
-            RecordState.rev_prescreen_included,
-            RecordState.pdf_needs_manual_retrieval,
-        ]:
+        if record_dict[Fields.STATUS] not in _PDF_GET_STATES:
             if Fields.FILE in record_dict:
                 record = colrev.record.record_pdf.PDFRecord(record_dict)
                 record.remove_field(key=Fields.FILE)
@@ -189,17 +260,7 @@ class PDFGet(colrev.process.operation.Operation):
 
         record = colrev.record.record_pdf.PDFRecord(record_dict)
 
-        for (
-            pdf_get_package_endpoint
-        ) in self.review_manager.settings.pdf_get.pdf_get_package_endpoints:
-
-            pdf_get_class = self.package_manager.get_package_endpoint_class(
-                package_type=EndpointType.pdf_get,
-                package_identifier=pdf_get_package_endpoint["endpoint"],
-            )
-            endpoint = pdf_get_class(
-                pdf_get_operation=self, settings=pdf_get_package_endpoint
-            )
+        for endpoint in self._get_endpoints():
 
             endpoint.get_pdf(record)  # type: ignore
 
@@ -220,6 +281,66 @@ class PDFGet(colrev.process.operation.Operation):
 
         return record.get_data()
 
+    def _load_cpid_cache(self) -> dict:
+        try:
+            with open(
+                self.review_manager.path / _CPID_CACHE_FILE, encoding="utf-8"
+            ) as file:
+                return json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_cpid_cache(self, cpid_cache: dict) -> None:
+        cpid_cache_path = self.review_manager.path / _CPID_CACHE_FILE
+        cpid_cache_path.parent.mkdir(exist_ok=True, parents=True)
+        with open(cpid_cache_path, "w", encoding="utf-8") as file:
+            json.dump(cpid_cache, file)
+
+    def _get_colrev_pdf_ids(self, pdf_paths: typing.List[Path]) -> dict:
+        # Note: cpids are cached across runs (keyed by the PDF's mtime and size)
+        # because hashing all PDFs is the main cost of relinking
+        cpid_cache = self._load_cpid_cache()
+        # Note: entries of PDFs that no longer exist are dropped
+        updated_cpid_cache = {}
+        colrev_pdf_ids: typing.Dict[Path, str] = {}
+        uncached_pdf_paths = []
+        for pdf_path in pdf_paths:
+            relative_path = pdf_path.relative_to(self.review_manager.path)
+            try:
+                stat = pdf_path.stat()
+                file_signature = [stat.st_mtime_ns, stat.st_size]
+            except OSError:
+                file_signature = []
+            cached = cpid_cache.get(str(relative_path))
+            if file_signature and cached and cached[:2] == file_signature:
+                colrev_pdf_ids[relative_path] = cached[2]
+                updated_cpid_cache[str(relative_path)] = cached
+            else:
+                # Note: placeholder to keep the order of pdf_paths
+                colrev_pdf_ids[relative_path] = ""
+                uncached_pdf_paths.append((pdf_path, relative_path, file_signature))
+
+        # Note: hashing (rendering the first page) is CPU-bound and pymupdf
+        # is not thread-safe. PDFs are therefore hashed in separate processes.
+        if len(uncached_pdf_paths) > 1:
+            with mp.Pool(min(mp.cpu_count(), len(uncached_pdf_paths))) as pool:
+                cpids = pool.map(
+                    _get_colrev_pdf_id_in_worker, [p for p, _, _ in uncached_pdf_paths]
+                )
+        else:
+            cpids = [""] * len(uncached_pdf_paths)
+
+        for (pdf_path, relative_path, file_signature), cpid in zip(
+            uncached_pdf_paths, cpids
+        ):
+            if not cpid:
+                cpid = colrev.record.record_pdf.PDFRecord.get_colrev_pdf_id(pdf_path)
+            colrev_pdf_ids[relative_path] = cpid
+            if file_signature:
+                updated_cpid_cache[str(relative_path)] = file_signature + [cpid]
+        self._save_cpid_cache(updated_cpid_cache)
+        return colrev_pdf_ids
+
     def _relink_pdfs(
         self,
         records: typing.Dict[str, typing.Dict],
@@ -230,7 +351,8 @@ class PDFGet(colrev.process.operation.Operation):
 
         # Relink files in source file
         corresponding_origin: str
-        source_records: typing.List[typing.Dict] = []
+        # Note: the colrev_pdf_ids do not depend on the source (calculated once)
+        pdf_candidates: typing.Optional[typing.Dict[Path, str]] = None
         for source in self.review_manager.settings.sources:
             if source.endpoint != "colrev.files_dir":
                 continue
@@ -244,15 +366,10 @@ class PDFGet(colrev.process.operation.Operation):
                 filename=source.filename,
                 logger=self.review_manager.logger,
             )
-            source_records = list(source_records_dict.values())
 
-            self.review_manager.logger.info("Calculate colrev_pdf_ids")
-            pdf_candidates = {
-                pdf_candidate.relative_to(
-                    self.review_manager.path
-                ): colrev.record.record_pdf.PDFRecord.get_colrev_pdf_id(pdf_candidate)
-                for pdf_candidate in list(pdf_dir.glob("**/*.pdf"))
-            }
+            if pdf_candidates is None:
+                self.review_manager.logger.info("Calculate colrev_pdf_ids")
+                pdf_candidates = self._get_colrev_pdf_ids(list(_scandir_pdfs(pdf_dir)))
 
             for record in records.values():
                 if Fields.FILE not in record:
@@ -263,19 +380,20 @@ class PDFGet(colrev.process.operation.Operation):
                 # (pdf hashes may change after import/preparation)
                 source_rec = {}
                 if corresponding_origin != "":
-                    source_origin_l = [
+                    # Note: the origin must be unique (stop at the second match)
+                    matching_origins = (
                         o for o in record[Fields.ORIGIN] if corresponding_origin in o
-                    ]
-                    if len(source_origin_l) == 1:
-                        source_origin = source_origin_l[0]
+                    )
+                    source_origin = next(matching_origins, None)
+                    if (
+                        source_origin is not None
+                        and next(matching_origins, None) is None
+                    ):
                         source_origin = source_origin.replace(
                             f"{corresponding_origin}/", ""
                         )
-                        source_rec_l = [
-                            s for s in source_records if s[Fields.ID] == source_origin
-                        ]
-                        if len(source_rec_l) == 1:
-                            source_rec = source_rec_l[0]
+                        # Note: the source records are indexed by their (unique) IDs
+                        source_rec = source_records_dict.get(source_origin, {})
 
                 if source_rec:
                     if (
@@ -300,9 +418,7 @@ class PDFGet(colrev.process.operation.Operation):
                         )
                         break
 
-            if len(source_records) > 0:
-                source_records_dict = {r[Fields.ID]: r for r in source_records}
-
+            if len(source_records_dict) > 0:
                 write_file(records_dict=source_records_dict, filename=source.filename)
 
             self.review_manager.dataset.add_changes(source.filename)
@@ -321,35 +437,49 @@ class PDFGet(colrev.process.operation.Operation):
         self.review_manager.dataset.save_records_dict(records)
         self.review_manager.dataset.create_commit(msg="Relink PDFs")
 
+    def _get_unlinked_pdfs(self, records: dict) -> typing.List[Path]:
+        linked_files = [x[Fields.FILE] for x in records.values() if Fields.FILE in x]
+        pdf_files = [
+            x
+            for x in _get_top_level_pdfs(self.review_manager.paths.pdf)
+            if not any(kw in x for kw in ["_with_lp.pdf", "_with_cp.pdf", "_ocr.pdf"])
+        ]
+
+        # Note: abspath does not access the file system (in contrast to resolve()).
+        # Symlinks are only resolved for the PDFs whose paths are not linked directly.
+        linked_pdfs = {os.path.abspath(x) for x in linked_files}
+        unlinked_files = [x for x in pdf_files if os.path.abspath(x) not in linked_pdfs]
+        if unlinked_files:
+            resolved_linked_pdfs = {os.path.realpath(x) for x in linked_files}
+            unlinked_files = [
+                x
+                for x in unlinked_files
+                if os.path.realpath(x) not in resolved_linked_pdfs
+            ]
+        return [Path(x) for x in unlinked_files]
+
     def check_existing_unlinked_pdfs(
         self,
         records: dict,
     ) -> dict:
         """Check for PDFs that are in the pdfs directory but not linked in the record file"""
 
-        linked_pdfs = [
-            str(Path(x[Fields.FILE]).resolve())
-            for x in records.values()
-            if Fields.FILE in x
-        ]
-        pdf_dir = self.review_manager.paths.pdf
-        pdf_files = glob(str(pdf_dir) + "/**.pdf", recursive=True)
-        unlinked_pdfs = [
-            Path(x)
-            for x in pdf_files
-            if str(Path(x).resolve()) not in linked_pdfs
-            and not any(kw in x for kw in ["_with_lp.pdf", "_with_cp.pdf", "_ocr.pdf"])
-        ]
-
+        unlinked_pdfs = self._get_unlinked_pdfs(records)
         if len(unlinked_pdfs) == 0:
             return records
 
         grobid_service = self.review_manager.get_grobid_service()
         grobid_service.start()
         self.review_manager.logger.info("Check unlinked PDFs")
+        candidates = [colrev.record.record.Record(r) for r in records.values()]
+        # Note: the candidates are prepared once (not for every unlinked PDF).
+        # Linking does not change the fields that are compared.
+        prepared_candidates: typing.List[dict] = []
         for file in unlinked_pdfs:
-            msg = f"Check unlinked PDF: {file.relative_to(self.review_manager.path)}"
-            self.review_manager.logger.info(msg)
+            # Note: %s-formatting is skipped if the message is filtered
+            self.review_manager.logger.info(
+                "Check unlinked PDF: %s", file.relative_to(self.review_manager.path)
+            )
             if file.stem not in records.keys():
                 tei = self.review_manager.get_tei(pdf_path=file)
                 pdf_record = tei.get_metadata()
@@ -357,17 +487,22 @@ class PDFGet(colrev.process.operation.Operation):
                 if "error" in pdf_record:
                     continue
 
-                max_similarity = 0.0
-                max_sim_record = None
-                for record in records.values():
-                    sim = colrev.record.record_pdf.PDFRecord.get_record_similarity(
+                if not prepared_candidates:
+                    prepared_candidates = (
+                        colrev.record.record_similarity.prepare_for_similarity(
+                            candidates
+                        )
+                    )
+                similarities = (
+                    colrev.record.record_similarity.get_prepared_record_similarities(
                         colrev.record.record_pdf.PDFRecord(pdf_record),
-                        colrev.record.record_pdf.PDFRecord(record.copy()),
+                        prepared_candidates,
                     )
-                    if sim > max_similarity:
-                        max_similarity = sim
-                        max_sim_record = record
-                if max_sim_record:
+                )
+                max_similarity = max(similarities, default=0.0)
+                if max_similarity > 0:
+                    # the first record with the maximum similarity (as before)
+                    max_sim_record = candidates[similarities.index(max_similarity)].data
                     if max_similarity > 0.5:
                         if RecordState.pdf_prepared == max_sim_record[Fields.STATUS]:
                             continue
@@ -385,11 +520,12 @@ class PDFGet(colrev.process.operation.Operation):
                         ):
                             record.set_status(RecordState.pdf_imported)
 
+                        # Note: report_logger and logger have separate handlers
                         self.review_manager.report_logger.info(
-                            "linked unlinked pdf:" f" {file.name}"
+                            "linked unlinked pdf: %s", file.name
                         )
                         self.review_manager.logger.info(
-                            "linked unlinked pdf:" f" {file.name}"
+                            "linked unlinked pdf: %s", file.name
                         )
                         # max_sim_record = \
                         #     pdf_prep.validate_pdf_metadata(max_sim_record)
@@ -397,8 +533,7 @@ class PDFGet(colrev.process.operation.Operation):
                         # if RecordState.pdf_needs_manual_preparation == colrev_status:
                         #     # revert?
             else:
-                record = records[file.stem]
-                self.link_pdf(colrev.record.record_pdf.PDFRecord(record))
+                self.link_pdf(colrev.record.record_pdf.PDFRecord(records[file.stem]))
 
         self.review_manager.dataset.save_records_dict(records)
 
@@ -410,16 +545,16 @@ class PDFGet(colrev.process.operation.Operation):
         record_dict: dict,
         file: Path,
         new_filename: Path,
-        pdfs_search_file: Path,
+        search_file_replacements: dict,
     ) -> None:
-        record_dict[Fields.FILE] = new_filename
-        if pdfs_search_file.is_file():
-            colrev.env.utils.inplace_change(
-                filename=pdfs_search_file,
-                old_string="{" + str(file) + "}",
-                new_string="{" + str(new_filename) + "}",
-            )
+        search_file_replacements["{" + str(file) + "}"] = "{" + str(new_filename) + "}"
+        record_dict[Fields.FILE] = str(new_filename)
+        if RecordState.rev_prescreen_included == record_dict[Fields.STATUS]:
+            record = colrev.record.record_pdf.PDFRecord(record_dict)
+            record.set_status(RecordState.pdf_imported)
 
+    def _move_pdf(self, move: typing.Tuple[Path, Path]) -> None:
+        file, new_filename = move
         if not file.is_file():
             corrected_path = Path(str(file).replace("  ", " "))
             if corrected_path.is_file():
@@ -430,11 +565,22 @@ class PDFGet(colrev.process.operation.Operation):
         elif file.is_symlink():
             shutil.move(str(file), str(new_filename))
 
-        record_dict[Fields.FILE] = str(new_filename)
-        self.review_manager.logger.info(f"rename {file.name} > {new_filename}")
-        if RecordState.rev_prescreen_included == record_dict[Fields.STATUS]:
-            record = colrev.record.record_pdf.PDFRecord(record_dict)
-            record.set_status(RecordState.pdf_imported)
+        self.review_manager.logger.info("rename %s > %s", file.name, new_filename)
+
+    def _move_pdfs(self, moves: typing.List[typing.Tuple[Path, Path]]) -> None:
+        sources = {file for file, _ in moves} | {
+            Path(str(file).replace("  ", " ")) for file, _ in moves
+        }
+        targets = {new_filename for _, new_filename in moves}
+        # Note: moves are independent (and run in parallel) if no file is moved
+        # twice and no target is the source of another move.
+        # Otherwise, the order matters and the files are moved sequentially.
+        if len({file for file, _ in moves}) == len(moves) and not sources & targets:
+            with Pool(4) as pool:
+                pool.map(self._move_pdf, moves)
+            return
+        for move in moves:
+            self._move_pdf(move)
 
     def rename_pdfs(self) -> None:
         """Rename the PDFs"""
@@ -446,13 +592,17 @@ class PDFGet(colrev.process.operation.Operation):
         # We may use other pdfs_search_files from the sources:
         # review_manager.settings.sources
         pdfs_search_file = Path("data/search/pdfs.bib")
+        # Note: the file links in the pdfs_search_file are replaced in one pass
+        search_file_replacements: typing.Dict[str, str] = {}
+        moves: typing.List[typing.Tuple[Path, Path]] = []
 
+        post_md_processed_states = RecordState.get_post_x_states(
+            state=RecordState.md_processed
+        )
         for record_dict in records.values():
             if Fields.FILE not in record_dict:
                 continue
-            if record_dict[Fields.STATUS] not in RecordState.get_post_x_states(
-                state=RecordState.md_processed
-            ):
+            if record_dict[Fields.STATUS] not in post_md_processed_states:
                 continue
 
             file = Path(record_dict[Fields.FILE])
@@ -468,9 +618,16 @@ class PDFGet(colrev.process.operation.Operation):
                 record_dict=record_dict,
                 file=file,
                 new_filename=new_filename,
-                pdfs_search_file=pdfs_search_file,
+                search_file_replacements=search_file_replacements,
             )
+            moves.append((file, new_filename))
+
+        self._move_pdfs(moves)
 
+        if pdfs_search_file.is_file():
+            colrev.env.utils.inplace_change_multiple(
+                filename=pdfs_search_file, replacements=search_file_replacements
+            )
         self.review_manager.dataset.save_records_dict(records)
 
         if pdfs_search_file.is_file():
@@ -484,16 +641,8 @@ class PDFGet(colrev.process.operation.Operation):
         )
         record_header_list = list(records_headers.values())
 
-        nr_tasks = len(
-            [
-                x
-                for x in record_header_list
-                if x[Fields.STATUS]
-                in [
-                    RecordState.pdf_needs_manual_retrieval,
-                    RecordState.rev_prescreen_included,
-                ]
-            ]
+        nr_tasks = sum(
+            1 for x in record_header_list if x[Fields.STATUS] in _PDF_GET_STATES
         )
 
         items = self.review_manager.dataset.read_next_record(
@@ -505,9 +654,10 @@ class PDFGet(colrev.process.operation.Operation):
 
         self.to_retrieve = nr_tasks
 
+        # Note: items is a generator (consumed by the pool in main())
         pdf_get_data = {
             "nr_tasks": nr_tasks,
-            "items": [{"record": item} for item in items],
+            "items": ({"record": item} for item in items),
         }
 
         return pdf_get_data
@@ -548,14 +698,12 @@ class PDFGet(colrev.process.operation.Operation):
 
     def _set_status_if_pdf_linked(self, records: dict) -> dict:
         for record_dict in records.values():
-            if record_dict[Fields.STATUS] in [
-                RecordState.rev_prescreen_included,
-                RecordState.pdf_needs_manual_retrieval,
-            ]:
-                record = colrev.record.record_pdf.PDFRecord(record_dict)
+            if record_dict[Fields.STATUS] in _PDF_GET_STATES:
                 if Fields.FILE in record_dict:
+                    record = colrev.record.record_pdf.PDFRecord(record_dict)
+                    # Note: os.path.isfile does not create a Path per file
                     if any(
-                        Path(fpath).is_file()
+                        os.path.isfile(fpath)
                         for fpath in record.data[Fields.FILE].split(";")
                     ):
                         if (
@@ -630,8 +778,14 @@ class PDFGet(colrev.process.operation.Operation):
                 "PDFs to get".ljust(38) + f'{pdf_get_data["nr_tasks"]} PDFs'
             )
 
+            # Note: retrieval times differ strongly between records (local/remote).
+            # imap_unordered hands out one record at a time (instead of the
+            # pre-assigned chunks of map), i.e., a slow record does not delay
+            # the other records in its chunk. The order of the results is not needed.
             pool = Pool(4)
-            retrieved_record_list = pool.map(self.get_pdf, pdf_get_data["items"])
+            retrieved_record_list = list(
+                pool.imap_unordered(self.get_pdf, pdf_get_data["items"])
+            )
             pool.close()
             pool.join()
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import csv
+import logging
 import typing
 from pathlib import Path
 
@@ -103,22 +104,18 @@ class PDFGetMan(colrev.process.operation.Operation):
         records_headers = self.review_manager.dataset.load_records_dict(
             header_only=True
         )
-        record_header_list = list(records_headers.values())
-        nr_tasks = len(
-            [
-                x
-                for x in record_header_list
-                if RecordState.pdf_needs_manual_retrieval == x[Fields.STATUS]
-            ]
+        nr_tasks, pad = self._get_nr_tasks_and_pad(
+            records=records_headers.values(),
+            state=RecordState.pdf_needs_manual_retrieval,
         )
-        pad = min((max(len(x[Fields.ID]) for x in record_header_list) + 2), 40)
         items = self.review_manager.dataset.read_next_record(
             conditions=[{Fields.STATUS: RecordState.pdf_needs_manual_retrieval}]
         )
         pdf_get_man_data = {"nr_tasks": nr_tasks, "PAD": pad, "items": items}
-        self.review_manager.logger.debug(
-            self.review_manager.p_printer.pformat(pdf_get_man_data)
-        )
+        if self.review_manager.logger.isEnabledFor(logging.DEBUG):
+            self.review_manager.logger.debug(
+                self.review_manager.p_printer.pformat(pdf_get_man_data)
+            )
         return pdf_get_man_data
 
     def pdfs_retrieved_manually(self) -> bool:
@@ -2,6 +2,7 @@
 """CoLRev pdf_prep_man operation: Prepare PDF documents manually."""
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 
 import pandas as pd
@@ -58,25 +59,19 @@ class PDFPrepMan(colrev.process.operation.Operation):
         records_headers = self.review_manager.dataset.load_records_dict(
             header_only=True
         )
-        record_header_list = list(records_headers.values())
-        nr_tasks = len(
-            [
-                x
-                for x in record_header_list
-                if RecordState.pdf_needs_manual_preparation == x[Fields.STATUS]
-            ]
+        nr_tasks, pad = self._get_nr_tasks_and_pad(
+            records=records_headers.values(),
+            state=RecordState.pdf_needs_manual_preparation,
         )
-        pad = 0
-        if record_header_list:
-            pad = min((max(len(x[Fields.ID]) for x in record_header_list) + 2), 40)
 
         items = self.review_manager.dataset.read_next_record(
             conditions=[{Fields.STATUS: RecordState.pdf_needs_manual_preparation}]
         )
         pdf_prep_man_data = {"nr_tasks": nr_tasks, "PAD": pad, "items": items}
-        self.review_manager.logger.debug(
-            self.review_manager.p_printer.pformat(pdf_prep_man_data)
-        )
+        if self.review_manager.logger.isEnabledFor(logging.DEBUG):
+            self.review_manager.logger.debug(
+                self.review_manager.p_printer.pformat(pdf_prep_man_data)
+            )
         return pdf_prep_man_data
 
     def pdfs_prepared_manually(self) -> bool:
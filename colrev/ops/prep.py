@@ -174,14 +174,10 @@ class Prep(colrev.process.operation.Operation):
     ) -> None:
 
         try:
-            if (
-                prep_round_package_endpoint["endpoint"].lower()
-                not in self.prep_package_endpoints
-            ):
+            endpoint_name = prep_round_package_endpoint["endpoint"].lower()
+            if endpoint_name not in self.prep_package_endpoints:
                 return
-            endpoint = self.prep_package_endpoints[
-                prep_round_package_endpoint["endpoint"].lower()
-            ]
+            endpoint = self.prep_package_endpoints[endpoint_name]
 
             prior = preparation_record.copy_prep_rec()
 
@@ -506,9 +502,8 @@ class Prep(colrev.process.operation.Operation):
             self.quality_model, set_prepared=not self.polish
         )
 
-        for prep_round_package_endpoint in deepcopy(
-            item["prep_round_package_endpoints"]
-        ):
+        # Note: the endpoint settings are only read (no need to copy them per record)
+        for prep_round_package_endpoint in item["prep_round_package_endpoints"]:
             try:
                 self._package_prep(
                     prep_round_package_endpoint,
@@ -766,13 +761,15 @@ class Prep(colrev.process.operation.Operation):
     def _log_record_change_scores(
         self, *, preparation_data: list, prepared_records: list
     ) -> None:
+        # Note: the prepared records are indexed once (the first record per ID)
+        prepared_records_by_id: typing.Dict[str, dict] = {}
+        for prepared_record in prepared_records:
+            prepared_records_by_id.setdefault(
+                prepared_record[Fields.ID], prepared_record
+            )
         for previous_record_item in preparation_data:
             previous_record = previous_record_item["record"]
-            prepared_record = [
-                r
-                for r in prepared_records
-                if r[Fields.ID] == previous_record.data[Fields.ID]
-            ][0]
+            prepared_record = prepared_records_by_id[previous_record.data[Fields.ID]]
 
             change = colrev.record.record_prep.PrepRecord.get_record_change_score(
                 colrev.record.record_prep.PrepRecord(prepared_record),
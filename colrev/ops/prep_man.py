@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import csv
+import logging
 from pathlib import Path
 
 import pandas as pd
@@ -218,18 +219,12 @@ class PrepMan(colrev.process.operation.Operation):
         records_headers = self.review_manager.dataset.load_records_dict(
             header_only=True
         )
-        record_header_list = list(records_headers.values())
-        nr_tasks = len(
-            [
-                x
-                for x in record_header_list
-                if RecordState.md_needs_manual_preparation == x[Fields.STATUS]
-            ]
+        nr_tasks, pad = self._get_nr_tasks_and_pad(
+            records=records_headers.values(),
+            state=RecordState.md_needs_manual_preparation,
+            max_pad=35,
         )
-
-        all_ids = [x[Fields.ID] for x in record_header_list]
-
-        pad = min((max(len(x[Fields.ID]) for x in record_header_list) + 2), 35)
+        all_ids = list(records_headers.keys())
 
         items = self.review_manager.dataset.read_next_record(
             conditions=[{Fields.STATUS: RecordState.md_needs_manual_preparation}]
@@ -241,9 +236,10 @@ class PrepMan(colrev.process.operation.Operation):
             "all_ids": all_ids,
             "PAD": pad,
         }
-        self.review_manager.logger.debug(
-            self.review_manager.p_printer.pformat(md_prep_man_data)
-        )
+        if self.review_manager.logger.isEnabledFor(logging.DEBUG):
+            self.review_manager.logger.debug(
+                self.review_manager.p_printer.pformat(md_prep_man_data)
+            )
         return md_prep_man_data
 
     def set_data(self, *, record_dict: dict) -> None:
@@ -65,14 +65,13 @@ class Prescreen(colrev.process.operation.Operation):
         )
 
     def _include_all_in_prescreen_precondition(self, records: dict) -> bool:
-        if not [
-            r for r in records.values() if r[Fields.STATUS] == RecordState.md_processed
-        ]:
-            if [
-                r
-                for r in records.values()
-                if r[Fields.STATUS] == RecordState.pdf_prepared
-            ]:
+        # Note: any() stops at the first match (no lists of records are created)
+        if not any(
+            r[Fields.STATUS] == RecordState.md_processed for r in records.values()
+        ):
+            if any(
+                r[Fields.STATUS] == RecordState.pdf_prepared for r in records.values()
+            ):
                 self.review_manager.logger.warning(
                     "No records to prescreen. Use "
                     f"{Colors.ORANGE}colrev screen --include_all{Colors.END} instead"
@@ -155,17 +154,9 @@ class Prescreen(colrev.process.operation.Operation):
         records_headers = self.review_manager.dataset.load_records_dict(
             header_only=True
         )
-        record_header_list = list(records_headers.values())
-        nr_tasks = len(
-            [
-                x
-                for x in record_header_list
-                if RecordState.md_processed == x[Fields.STATUS]
-            ]
+        nr_tasks, pad = self._get_nr_tasks_and_pad(
+            records=records_headers.values(), state=RecordState.md_processed
         )
-        pad = 0
-        if record_header_list:
-            pad = min((max(len(x[Fields.ID]) for x in record_header_list) + 2), 40)
         items = self.review_manager.dataset.read_next_record(
             conditions=[{Fields.STATUS: RecordState.md_processed}]
         )
@@ -281,22 +272,25 @@ class Prescreen(colrev.process.operation.Operation):
         record: colrev.record.record.Record,
         prescreen_inclusion: bool,
         PAD: int = 40,
+        save: bool = True,
     ) -> None:
-        """Save the prescreen decision"""
+        """Save the prescreen decision
+
+        With save=False, the decision is only set in the record
+        (callers save the decided records together).
+        """
         if prescreen_inclusion:
             self.review_manager.report_logger.info(
                 f" {record.data['ID']}".ljust(PAD, " ") + "Included in prescreen"
             )
             record.set_status(RecordState.rev_prescreen_included)
-            self.review_manager.dataset.save_records_dict(
-                {record.data[Fields.ID]: record.get_data()}, partial=True
-            )
-
         else:
             self.review_manager.report_logger.info(
                 f" {record.data['ID']}".ljust(PAD, " ") + "Excluded in prescreen"
             )
             record.set_status(RecordState.rev_prescreen_excluded)
+
+        if save:
             self.review_manager.dataset.save_records_dict(
                 {record.data[Fields.ID]: record.get_data()}, partial=True
             )
@@ -313,13 +307,13 @@ class Prescreen(colrev.process.operation.Operation):
         self.review_manager.logger.info(
             f"{Colors.GREEN}Automatically including records with include_flag{Colors.END}"
         )
-        for record_dict in records.values():
-            if record_dict[Fields.ID] not in selected_auto_include_ids:
-                continue
-            self.prescreen(
-                record=colrev.record.record.Record(record_dict),
-                prescreen_inclusion=True,
-            )
+        # Note: the included records are saved together (in one partial save)
+        included_records = {}
+        for record_id in selected_auto_include_ids:
+            record = colrev.record.record.Record(records[record_id])
+            self.prescreen(record=record, prescreen_inclusion=True, save=False)
+            included_records[record_id] = record.get_data()
+        self.review_manager.dataset.save_records_dict(included_records, partial=True)
         return selected_auto_include_ids
 
     @colrev.process.operation.Operation.decorate()
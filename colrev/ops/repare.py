@@ -279,7 +279,7 @@ class Repare(colrev.process.operation.Operation):
             elif "DBLP.bib" in options:
                 source_origin = "DBLP.bib"
             else:
-                source_origin = [k for k, v in options.items() if v == value][0]
+                source_origin = next(k for k, v in options.items() if v == value)
 
             for origin in record.data[Fields.ORIGIN]:
                 origin_parts = origin.split("/", 1)  # Split on the first "/"
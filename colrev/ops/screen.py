@@ -130,11 +130,12 @@ class Screen(colrev.process.operation.Operation):
         # pylint: disable=duplicate-code
         records = self.review_manager.dataset.load_records_dict()
 
-        nr_tasks = len([r for r in records.values() if self.to_screen(r)])
-        items = [r for r in records.values() if self.to_screen(r)]
-        pad = 0
-        if items:
-            pad = min((max(len(x[Fields.ID]) for x in items) + 2), 35)
+        items = [
+            record_dict
+            for record_dict in records.values()
+            if self.to_screen(record_dict)
+        ]
+        nr_tasks, pad = self._get_nr_tasks_and_pad(records=items, max_pad=35)
         screen_data = {"nr_tasks": nr_tasks, "PAD": pad, "items": items}
 
         # self.review_manager.logger.debug(
@@ -349,8 +350,14 @@ class Screen(colrev.process.operation.Operation):
         screen_inclusion: bool,
         screening_criteria: str,
         PAD: int = 40,
+        save: bool = True,
     ) -> None:
-        """Save the screen decision"""
+        """Save the screen decision
+
+        With save=False, the decision is only set in the record
+        (callers save the screened records together).
+        """
+        # pylint: disable=too-many-arguments
 
         PAD = 40
         if screen_inclusion:
@@ -375,10 +382,11 @@ class Screen(colrev.process.operation.Operation):
                 f" {record.data['ID']}".ljust(PAD, " ") + "Excluded in screen"
             )
 
-        record_dict = record.get_data()
-        self.review_manager.dataset.save_records_dict(
-            {record_dict[Fields.ID]: record_dict}, partial=True
-        )
+        if save:
+            record_dict = record.get_data()
+            self.review_manager.dataset.save_records_dict(
+                {record_dict[Fields.ID]: record_dict}, partial=True
+            )
 
     def _auto_include(self, records: dict) -> list:
         selected_auto_include_ids = [
@@ -373,11 +373,11 @@ class Search(colrev.process.operation.Operation):
                         best_candidate_pos = i + 1
                         max_conf = heuristic_candidate["confidence"]
                 if not any(c["confidence"] > 0.1 for c in results_list):
-                    source = [
+                    source = next(
                         x
                         for x in results_list
                         if x["source_candidate"].endpoint == "colrev.unknown_source"
-                    ][0]
+                    )
                 else:
                     selection = str(best_candidate_pos)
                     source = results_list[int(selection) - 1]
@@ -6,13 +6,13 @@ import json
 import re
 import shutil
 import typing
+from functools import lru_cache
 from importlib.metadata import version
 from pathlib import Path
 
 import git
-import pandas as pd
+import yaml
 from tqdm import tqdm
-from yaml import safe_load
 
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
@@ -27,6 +27,48 @@ from colrev.writer.write_utils import to_string
 
 # pylint: disable=too-few-public-methods
 
+# Note: the libyaml-based loader is used if available (pure-Python fallback)
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Fields renamed in the 0.9.3 migration (old key: new key)
+_RENAMED_FIELDS_0_9_3 = {
+    "pubmedid": "colrev.pubmed.pubmedid",
+    "pii": "colrev.pubmed.pii",
+    "pmc": "colrev.pubmed.pmc",
+    "label_included": "colrev.synergy_datasets.label_included",
+    "method": "colrev.synergy_datasets.method",
+    "dblp_key": Fields.DBLP_KEY,
+    "wos_accession_number": Fields.WEB_OF_SCIENCE_ID,
+    "sem_scholar_id": Fields.SEMANTIC_SCHOLAR_ID,
+    "openalex_id": "colrev.open_alex.id",
+}
+
+# Fields (and their provenance) removed in the 0.8.3 migration
+_REMOVED_FIELDS_0_8_3 = ("cited_by_file", "cited_by_id", "tei_id")
+
+# pdf-prep endpoints removed in the 0.11.0 migration
+_REMOVED_PDF_PREP_ENDPOINTS_0_11_0 = frozenset(
+    {
+        "colrev.check_ocr",
+        "colrev.pdf_check_ocr",
+        "colrev.validate_pdf_metadata",
+        "colrev.validate_completeness",
+        "colrev.create_tei",
+        "colrev.tei_prep",
+    }
+)
+
+
+@lru_cache(maxsize=1)
+def _get_changelog_lines() -> typing.Tuple[str, ...]:
+    # Note: the CHANGELOG is split once (release notes are printed for each step)
+    filedata = colrev.env.utils.get_package_file_content(
+        module="colrev", filename=Path("../CHANGELOG.md")
+    )
+    if not filedata:
+        return ()
+    return tuple(filedata.decode("utf-8").split("\n"))
+
 
 class Upgrade(colrev.process.operation.Operation):
     """Upgrade a CoLRev project"""
@@ -59,15 +101,33 @@ class Upgrade(colrev.process.operation.Operation):
 
     def _load_settings_dict(self) -> dict:
         settings_path = self.review_manager.paths.settings
-        if not settings_path.is_file():
-            raise colrev_exceptions.CoLRevException()
-        with open(settings_path, encoding="utf-8") as file:
-            settings = json.load(file)
-        return settings
+        # Note: reading the file directly avoids a separate is_file() probe
+        try:
+            settings_bytes = settings_path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError) as exc:
+            raise colrev_exceptions.CoLRevException() from exc
+        return json.loads(settings_bytes)
 
     def _save_settings(self, settings: dict) -> None:
+        # Note: json.dump writes each encoded chunk separately (one write instead)
+        settings_str = json.dumps(settings, indent=4)
         with open("settings.json", "w", encoding="utf-8") as outfile:
-            json.dump(settings, outfile, indent=4)
+            outfile.write(settings_str)
+        self.repo.index.add(["settings.json"])
+
+    def _rewrite_settings(self, mutator: typing.Callable[[dict], None]) -> None:
+        """Load, modify (mutator) and save the settings (opening the file once)"""
+        settings_path = self.review_manager.paths.settings
+        try:
+            file = open(settings_path, "r+b")  # pylint: disable=consider-using-with
+        except (FileNotFoundError, IsADirectoryError) as exc:
+            raise colrev_exceptions.CoLRevException() from exc
+        with file:
+            settings = json.loads(file.read())
+            mutator(settings)
+            file.seek(0)
+            file.truncate()
+            file.write(json.dumps(settings, indent=4).encode("utf-8"))
         self.repo.index.add(["settings.json"])
 
     def load_records_dict(self) -> dict:
@@ -100,7 +160,8 @@ class Upgrade(colrev.process.operation.Operation):
         """Upgrade a CoLRev project (main entrypoint)"""
 
         try:
-            self.repo = git.Repo(str(self.review_manager.path))
+            # Note: reuse the repository handle of the dataset
+            self.repo = self.review_manager.dataset.get_repo()
             self.repo.iter_commits()
         except ValueError:
             # Git repository has no initial commit
@@ -113,6 +174,11 @@ class Upgrade(colrev.process.operation.Operation):
         # Start with the first step if the version is older:
         settings_version = max(settings_version, CoLRevVersion("0.7.0"))
         installed_colrev_version = CoLRevVersion(version("colrev"))
+        if installed_colrev_version == settings_version:
+            # Note: nothing to migrate (the project is up-to-date)
+            print(f"installed_colrev_version: {installed_colrev_version}")
+            print(f"settings_version: {settings_version}")
+            return
 
         # version: indicates from which version on the migration should be applied
         migration_scripts: typing.List[typing.Dict[str, typing.Any]] = [
@@ -204,8 +270,8 @@ class Upgrade(colrev.process.operation.Operation):
 
         # skipping_versions_before_settings_version = True
         run_migration = False
-        while migration_scripts:
-            migrator = migration_scripts.pop(0)
+        # Note: the scripts are iterated in order (instead of pop(0), which is O(n))
+        for migrator in migration_scripts:
             # Activate run_migration for the current settings_version
             if (
                 migrator["target_version"] >= settings_version
@@ -231,9 +297,10 @@ class Upgrade(colrev.process.operation.Operation):
             print("migration not run")
             return
 
-        settings = self._load_settings_dict()
-        settings["project"]["colrev_version"] = str(installed_colrev_version)
-        self._save_settings(settings)
+        def _set_colrev_version(settings: dict) -> None:
+            settings["project"]["colrev_version"] = str(installed_colrev_version)
+
+        self._rewrite_settings(_set_colrev_version)
 
         if self.repo.is_dirty():
             msg = f"Upgrade to CoLRev {installed_colrev_version}"
@@ -245,21 +312,18 @@ class Upgrade(colrev.process.operation.Operation):
             )
 
     def _print_release_notes(self, *, selected_version: CoLRevVersion) -> None:
-        filedata = colrev.env.utils.get_package_file_content(
-            module="colrev", filename=Path("../CHANGELOG.md")
-        )
         active, printed = False, False
-        if filedata:
-            for line in filedata.decode("utf-8").split("\n"):
-                if str(selected_version) in line:
-                    active = True
-                    print(f"{Colors.ORANGE}Release notes v{selected_version}")
-                    continue
-                if line.startswith("## "):
-                    active = False
-                if active:
-                    print(line)
-                    printed = True
+        for line in _get_changelog_lines():
+            if str(selected_version) in line:
+                active = True
+                print(f"{Colors.ORANGE}Release notes v{selected_version}")
+                continue
+            if active and line.startswith("## "):
+                # Note: the release notes of selected_version are complete
+                break
+            if active:
+                print(line)
+                printed = True
         if not printed:
             print(f"{Colors.ORANGE}No release notes")
         print(f"{Colors.END}")
@@ -304,23 +368,21 @@ class Upgrade(colrev.process.operation.Operation):
 
         return self.repo.is_dirty()
 
+    def _update_colrev_update_workflow(self) -> None:
+        # Note: shared by the 0.8.0 and 0.8.1 migrations
+        template_file = Path("ops/init/colrev_update.yml")
+        if "colrev/curated_metadata" in str(self.review_manager.path):
+            template_file = Path("ops/init/colrev_update_curation.yml")
+        Path(".github/workflows/colrev_update.yml").unlink(missing_ok=True)
+        colrev.env.utils.retrieve_package_file(
+            template_file=template_file,
+            target=Path(".github/workflows/colrev_update.yml"),
+        )
+        self.repo.index.add([".github/workflows/colrev_update.yml"])
+
     def _migrate_0_8_0(self) -> bool:
         Path(".github/workflows/").mkdir(exist_ok=True, parents=True)
-
-        if "colrev/curated_metadata" in str(self.review_manager.path):
-            Path(".github/workflows/colrev_update.yml").unlink(missing_ok=True)
-            colrev.env.utils.retrieve_package_file(
-                template_file=Path("ops/init/colrev_update_curation.yml"),
-                target=Path(".github/workflows/colrev_update.yml"),
-            )
-            self.repo.index.add([".github/workflows/colrev_update.yml"])
-        else:
-            Path(".github/workflows/colrev_update.yml").unlink(missing_ok=True)
-            colrev.env.utils.retrieve_package_file(
-                template_file=Path("ops/init/colrev_update.yml"),
-                target=Path(".github/workflows/colrev_update.yml"),
-            )
-            self.repo.index.add([".github/workflows/colrev_update.yml"])
+        self._update_colrev_update_workflow()
 
         Path(".github/workflows/pre-commit.yml").unlink(missing_ok=True)
         colrev.env.utils.retrieve_package_file(
@@ -332,30 +394,20 @@ class Upgrade(colrev.process.operation.Operation):
 
     def _migrate_0_8_1(self) -> bool:
         Path(".github/workflows/").mkdir(exist_ok=True, parents=True)
-        if "colrev/curated_metadata" in str(self.review_manager.path):
-            Path(".github/workflows/colrev_update.yml").unlink(missing_ok=True)
-            colrev.env.utils.retrieve_package_file(
-                template_file=Path("ops/init/colrev_update_curation.yml"),
-                target=Path(".github/workflows/colrev_update.yml"),
-            )
-            self.repo.index.add([".github/workflows/colrev_update.yml"])
-        else:
-            Path(".github/workflows/colrev_update.yml").unlink(missing_ok=True)
-            colrev.env.utils.retrieve_package_file(
-                template_file=Path("ops/init/colrev_update.yml"),
-                target=Path(".github/workflows/colrev_update.yml"),
-            )
-            self.repo.index.add([".github/workflows/colrev_update.yml"])
+        self._update_colrev_update_workflow()
 
-        settings = self._load_settings_dict()
-        settings["project"]["auto_upgrade"] = True
-        self._save_settings(settings)
+        def _set_auto_upgrade(settings: dict) -> None:
+            settings["project"]["auto_upgrade"] = True
+
+        self._rewrite_settings(_set_auto_upgrade)
 
         return self.repo.is_dirty()
 
     def _migrate_0_8_2(self) -> bool:
         records = self.review_manager.dataset.load_records_dict()
 
+        # Note: records are only saved (serialized) if a record was changed
+        changed = False
         for record_dict in tqdm(records.values()):
             if "colrev_pdf_id" not in record_dict:
                 continue
@@ -368,16 +420,19 @@ class Upgrade(colrev.process.operation.Operation):
             colrev_pdf_id = colrev.record.record.Record.get_colrev_pdf_id(pdf_path)
             # pylint: disable=colrev-missed-constant-usage
             record_dict["colrev_pdf_id"] = colrev_pdf_id
+            changed = True
 
-        self.review_manager.dataset.save_records_dict(records)
+        if changed:
+            self.review_manager.dataset.save_records_dict(records)
 
         return self.repo.is_dirty()
 
     def _migrate_0_8_3(self) -> bool:
         # pylint: disable=too-many-branches
+        path_str = str(self.review_manager.path)
         settings = self._load_settings_dict()
         settings["prep"]["defects_to_ignore"] = []
-        if "curated_metadata" in str(self.review_manager.path):
+        if "curated_metadata" in path_str:
             settings["prep"]["defects_to_ignore"] = [
                 "record-not-in-toc",
                 "inconsistent-with-url-metadata",
@@ -393,7 +448,7 @@ class Upgrade(colrev.process.operation.Operation):
             ]
         self._save_settings(settings)
         self.review_manager = colrev.review_manager.ReviewManager(
-            path_str=str(self.review_manager.path), force_mode=True
+            path_str=path_str, force_mode=True
         )
         self.review_manager.load_settings()
         self.review_manager.get_load_operation()
@@ -412,19 +467,10 @@ class Upgrade(colrev.process.operation.Operation):
                 prov["note"] = ""
             for key in not_missing_fields:
                 record_dict[Fields.MD_PROV][key]["note"] = "not-missing"
-            if "cited_by_file" in record_dict:
-                del record_dict["cited_by_file"]
-            if "cited_by_id" in record_dict:
-                del record_dict["cited_by_id"]
-            if "tei_id" in record_dict:
-                del record_dict["tei_id"]
-            if Fields.D_PROV in record_dict:
-                if "cited_by_file" in record_dict[Fields.D_PROV]:
-                    del record_dict[Fields.D_PROV]["cited_by_file"]
-                if "cited_by_id" in record_dict[Fields.D_PROV]:
-                    del record_dict[Fields.D_PROV]["cited_by_id"]
-                if "tei_id" in record_dict[Fields.D_PROV]:
-                    del record_dict[Fields.D_PROV]["tei_id"]
+            for key in _REMOVED_FIELDS_0_8_3:
+                record_dict.pop(key, None)
+                if Fields.D_PROV in record_dict:
+                    record_dict[Fields.D_PROV].pop(key, None)
 
             record = colrev.record.record.Record(record_dict)
             prior_state = record.data[Fields.STATUS]
@@ -438,6 +484,7 @@ class Upgrade(colrev.process.operation.Operation):
 
     def _migrate_0_8_4(self) -> bool:
         records = self.review_manager.dataset.load_records_dict()
+        changed = False
         for record in records.values():
             if Fields.EDITOR not in record.get(Fields.D_PROV, {}):
                 continue
@@ -445,17 +492,19 @@ class Upgrade(colrev.process.operation.Operation):
             del record[Fields.D_PROV][Fields.EDITOR]
             if FieldValues.CURATED not in record[Fields.MD_PROV]:
                 record[Fields.MD_PROV][Fields.EDITOR] = ed_val
+            changed = True
 
-        self.review_manager.dataset.save_records_dict(records)
+        if changed:
+            self.review_manager.dataset.save_records_dict(records)
 
         return self.repo.is_dirty()
 
     def _migrate_0_9_1(self) -> bool:
-        settings = self._load_settings_dict()
-        for source in settings["sources"]:
-            if "load_conversion_package_endpoint" in source:
-                del source["load_conversion_package_endpoint"]
-        self._save_settings(settings)
+        def _drop_load_conversion_endpoints(settings: dict) -> None:
+            for source in settings["sources"]:
+                source.pop("load_conversion_package_endpoint", None)
+
+        self._rewrite_settings(_drop_load_conversion_endpoints)
         return self.repo.is_dirty()
 
     # pylint: disable=too-many-branches
@@ -473,51 +522,20 @@ class Upgrade(colrev.process.operation.Operation):
         self._save_settings(settings)
 
         records = self.load_records_dict()
+        changed = False
         for record_dict in records.values():
-            if "pubmedid" in record_dict:
-                record = colrev.record.record.Record(record_dict)
-                record.rename_field(key="pubmedid", new_key="colrev.pubmed.pubmedid")
-
-            if "pii" in record_dict:
-                record = colrev.record.record.Record(record_dict)
-                record.rename_field(key="pii", new_key="colrev.pubmed.pii")
-
-            if "pmc" in record_dict:
-                record = colrev.record.record.Record(record_dict)
-                record.rename_field(key="pmc", new_key="colrev.pubmed.pmc")
-
-            if "label_included" in record_dict:
-                record = colrev.record.record.Record(record_dict)
-                record.rename_field(
-                    key="label_included",
-                    new_key="colrev.synergy_datasets.label_included",
-                )
-            if "method" in record_dict:
-                record = colrev.record.record.Record(record_dict)
-                record.rename_field(
-                    key="method", new_key="colrev.synergy_datasets.method"
-                )
-
-            if "dblp_key" in record_dict:
-                record = colrev.record.record.Record(record_dict)
-                record.rename_field(key="dblp_key", new_key=Fields.DBLP_KEY)
-            if "wos_accession_number" in record_dict:
-                record = colrev.record.record.Record(record_dict)
-                record.rename_field(
-                    key="wos_accession_number",
-                    new_key=Fields.WEB_OF_SCIENCE_ID,
-                )
-            if "sem_scholar_id" in record_dict:
-                record = colrev.record.record.Record(record_dict)
-                record.rename_field(
-                    key="sem_scholar_id", new_key=Fields.SEMANTIC_SCHOLAR_ID
-                )
-
-            if "openalex_id" in record_dict:
-                record = colrev.record.record.Record(record_dict)
-                record.rename_field(key="openalex_id", new_key="colrev.open_alex.id")
+            # Note: the Record is created once (only if a field is renamed)
+            record = None
+            for key, new_key in _RENAMED_FIELDS_0_9_3.items():
+                if key not in record_dict:
+                    continue
+                if record is None:
+                    record = colrev.record.record.Record(record_dict)
+                record.rename_field(key=key, new_key=new_key)
+                changed = True
 
-        self.save_records_dict(records)
+        if changed:
+            self.save_records_dict(records)
 
         return self.repo.is_dirty()
 
@@ -538,23 +556,14 @@ class Upgrade(colrev.process.operation.Operation):
         settings = self._load_settings_dict()
         for prep_round in settings["prep"]["prep_rounds"]:
             for prep_package in prep_round["prep_package_endpoints"]:
-                for old, new in prep_replacements.items():
-                    if prep_package["endpoint"] == old:
-                        prep_package["endpoint"] = new
+                prep_package["endpoint"] = prep_replacements.get(
+                    prep_package["endpoint"], prep_package["endpoint"]
+                )
         for source in settings["sources"]:
             if source["endpoint"] == "colrev.pdfs_dir":
                 source["endpoint"] = "colrev.files_dir"
             if (
-                source["endpoint"] == "colrev.dblp"
-                and "scope" in source["search_parameters"]
-            ):
-                if "query" in source["search_parameters"]:
-                    source["search_type"] = "API"
-                else:
-                    source["search_type"] = "TOC"
-
-            if (
-                source["endpoint"] == "colrev.crossref"
+                source["endpoint"] in ("colrev.dblp", "colrev.crossref")
                 and "scope" in source["search_parameters"]
             ):
                 if "query" in source["search_parameters"]:
@@ -598,15 +607,7 @@ class Upgrade(colrev.process.operation.Operation):
         ] + [
             x
             for x in settings["pdf_prep"]["pdf_prep_package_endpoints"]
-            if x["endpoint"]
-            not in [
-                "colrev.check_ocr",
-                "colrev.pdf_check_ocr",
-                "colrev.validate_pdf_metadata",
-                "colrev.validate_completeness",
-                "colrev.create_tei",
-                "colrev.tei_prep",
-            ]
+            if x["endpoint"] not in _REMOVED_PDF_PREP_ENDPOINTS_0_11_0
         ]
 
         if settings["project"]["review_type"] == "curated_masterdata":
@@ -640,13 +641,17 @@ class Upgrade(colrev.process.operation.Operation):
         self._save_settings(settings)
 
         records = self.load_records_dict()
+        changed = False
         for record_dict in records.values():
             if Fields.MD_PROV in record_dict:
-                for key, value in record_dict[Fields.MD_PROV].items():
-                    record_dict[Fields.MD_PROV][key]["note"] = value["note"].replace(
-                        "not-missing", "IGNORE:missing"
-                    )
-        self.save_records_dict(records)
+                for value in record_dict[Fields.MD_PROV].values():
+                    if "not-missing" in value["note"]:
+                        value["note"] = value["note"].replace(
+                            "not-missing", "IGNORE:missing"
+                        )
+                        changed = True
+        if changed:
+            self.save_records_dict(records)
 
         return self.repo.is_dirty()
 
@@ -670,8 +675,9 @@ class Upgrade(colrev.process.operation.Operation):
                 f"Found a yaml file, converting to json, it will be backed up as {backup_file}"
             )
             with open(registry_yaml, encoding="utf8") as file:
-                environment_registry_df = pd.json_normalize(safe_load(file))
-                repos = environment_registry_df.to_dict("records")
+                # Note: the registry is a list of (flat) repo dicts
+                # (no DataFrame needed to iterate it)
+                repos = yaml.load(file, Loader=_SafeLoader) or []
                 environment_registry = {
                     "local_index": {
                         "repos": repos,
@@ -25,6 +25,22 @@ if typing.TYPE_CHECKING:  # pragma: no cover
 
 # pylint: disable=too-few-public-methods
 
+# Commands for adding an endpoint (per endpoint type)
+_ADD_COMMANDS = {
+    EndpointType.review_type: "init --type",
+    EndpointType.search_source: "search --add",
+    EndpointType.prep: "prep --add",
+    EndpointType.prep_man: "prep-man --add",
+    EndpointType.dedupe: "dedupe --add",
+    EndpointType.prescreen: "prescreen --add",
+    EndpointType.pdf_get: "pdf-get --add",
+    EndpointType.pdf_get_man: "pdf-get-man --add",
+    EndpointType.pdf_prep: "pdf-prep --add",
+    EndpointType.pdf_prep_man: "pdf-prep-man --add",
+    EndpointType.screen: "screen --add",
+    EndpointType.data: "data --add",
+}
+
 
 class DocRegistryManager:
     """DocRegistryManager"""
@@ -33,15 +49,15 @@ class DocRegistryManager:
         self,
         *,
         package_manager: colrev.package_manager.package_manager.PackageManager,
-        packages: typing.List[colrev.package_manager.package.Package],
+        packages: list[colrev.package_manager.package.Package],
     ) -> None:
         self.package_manager = package_manager
         self.packages = packages
 
-        self.package_endpoints_json: typing.Dict[str, list] = {
+        self.package_endpoints_json: dict[str, list] = {
             x.name: [] for x in colrev.package_manager.interfaces.ENDPOINT_OVERVIEW
         }
-        self.docs_for_index: typing.Dict[str, list] = {}
+        self.docs_for_index: dict[str, list] = {}
 
         self._colrev_path = self._get_colrev_path()
 
@@ -227,30 +243,10 @@ class DocRegistryManager:
             if package.has_endpoint(endpoint_type):
                 header_info += f"   * - {endpoint_type.value}\n"
                 header_info += f"     - |{package.status.upper()}|\n"
-                if endpoint_type == EndpointType.review_type:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev init --type {package.name}\n\n"
-                elif endpoint_type == EndpointType.search_source:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev search --add {package.name}\n\n"
-                elif endpoint_type == EndpointType.prep:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev prep --add {package.name}\n\n"
-                elif endpoint_type == EndpointType.prep_man:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev prep-man --add {package.name}\n\n"
-                elif endpoint_type == EndpointType.dedupe:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev dedupe --add {package.name}\n\n"
-                elif endpoint_type == EndpointType.prescreen:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev prescreen --add {package.name}\n\n"
-                elif endpoint_type == EndpointType.pdf_get:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev pdf-get --add {package.name}\n\n"
-                elif endpoint_type == EndpointType.pdf_get_man:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev pdf-get-man --add {package.name}\n\n"
-                elif endpoint_type == EndpointType.pdf_prep:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev pdf-prep --add {package.name}\n\n"
-                elif endpoint_type == EndpointType.pdf_prep_man:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev pdf-prep-man --add {package.name}\n\n"
-                elif endpoint_type == EndpointType.screen:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev screen --add {package.name}\n\n"
-                elif endpoint_type == EndpointType.data:
-                    header_info += f"     - .. code-block:: \n\n\n         colrev data --add {package.name}\n\n"
+                header_info += (
+                    "     - .. code-block:: \n\n\n         "
+                    f"colrev {_ADD_COMMANDS[endpoint_type]} {package.name}\n\n"
+                )
 
         return header_info
 
@@ -280,7 +276,7 @@ class DocRegistryManager:
         return str(file_path)
 
     def _extract_search_source_types(self) -> None:
-        search_source_types: typing.Dict[str, list] = {}
+        search_source_types: dict[str, list] = {}
         for search_source_type in SearchType:
             if search_source_type.value not in search_source_types:
                 search_source_types[search_source_type.value] = []
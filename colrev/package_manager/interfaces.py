@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import typing
+from dataclasses import dataclass
 from pathlib import Path
 
 import zope.interface
@@ -272,65 +273,76 @@ class DataInterface(
         """Get advice on how to operate the data package endpoint"""
 
 
-ENDPOINT_OVERVIEW = {
-    EndpointType.review_type: {
-        "import_name": ReviewTypeInterface,
-        "custom_class": "CustomReviewType",
-        "operation_name": "operation",
-    },
-    EndpointType.search_source: {
-        "import_name": SearchSourceInterface,
-        "custom_class": "CustomSearchSource",
-        "operation_name": "source_operation",
-    },
-    EndpointType.prep: {
-        "import_name": PrepInterface,
-        "custom_class": "CustomPrep",
-        "operation_name": "prep_operation",
-    },
-    EndpointType.prep_man: {
-        "import_name": PrepManInterface,
-        "custom_class": "CustomPrepMan",
-        "operation_name": "prep_man_operation",
-    },
-    EndpointType.dedupe: {
-        "import_name": DedupeInterface,
-        "custom_class": "CustomDedupe",
-        "operation_name": "dedupe_operation",
-    },
-    EndpointType.prescreen: {
-        "import_name": PrescreenInterface,
-        "custom_class": "CustomPrescreen",
-        "operation_name": "prescreen_operation",
-    },
-    EndpointType.pdf_get: {
-        "import_name": PDFGetInterface,
-        "custom_class": "CustomPDFGet",
-        "operation_name": "pdf_get_operation",
-    },
-    EndpointType.pdf_get_man: {
-        "import_name": PDFGetManInterface,
-        "custom_class": "CustomPDFGetMan",
-        "operation_name": "pdf_get_man_operation",
-    },
-    EndpointType.pdf_prep: {
-        "import_name": PDFPrepInterface,
-        "custom_class": "CustomPDFPrep",
-        "operation_name": "pdf_prep_operation",
-    },
-    EndpointType.pdf_prep_man: {
-        "import_name": PDFPrepManInterface,
-        "custom_class": "CustomPDFPrepMan",
-        "operation_name": "pdf_prep_man_operation",
-    },
-    EndpointType.screen: {
-        "import_name": ScreenInterface,
-        "custom_class": "CustomScreen",
-        "operation_name": "screen_operation",
-    },
-    EndpointType.data: {
-        "import_name": DataInterface,
-        "custom_class": "CustomData",
-        "operation_name": "data_operation",
-    },
+@dataclass(frozen=True)
+class EndpointTypeInfo:
+    """Interface definition, custom class and operation name of an endpoint type"""
+
+    __slots__ = ("import_name", "custom_class", "operation_name")
+
+    import_name: typing.Any
+    custom_class: str
+    operation_name: str
+
+
+ENDPOINT_OVERVIEW: dict[EndpointType, EndpointTypeInfo] = {
+    EndpointType.review_type: EndpointTypeInfo(
+        import_name=ReviewTypeInterface,
+        custom_class="CustomReviewType",
+        operation_name="operation",
+    ),
+    EndpointType.search_source: EndpointTypeInfo(
+        import_name=SearchSourceInterface,
+        custom_class="CustomSearchSource",
+        operation_name="source_operation",
+    ),
+    EndpointType.prep: EndpointTypeInfo(
+        import_name=PrepInterface,
+        custom_class="CustomPrep",
+        operation_name="prep_operation",
+    ),
+    EndpointType.prep_man: EndpointTypeInfo(
+        import_name=PrepManInterface,
+        custom_class="CustomPrepMan",
+        operation_name="prep_man_operation",
+    ),
+    EndpointType.dedupe: EndpointTypeInfo(
+        import_name=DedupeInterface,
+        custom_class="CustomDedupe",
+        operation_name="dedupe_operation",
+    ),
+    EndpointType.prescreen: EndpointTypeInfo(
+        import_name=PrescreenInterface,
+        custom_class="CustomPrescreen",
+        operation_name="prescreen_operation",
+    ),
+    EndpointType.pdf_get: EndpointTypeInfo(
+        import_name=PDFGetInterface,
+        custom_class="CustomPDFGet",
+        operation_name="pdf_get_operation",
+    ),
+    EndpointType.pdf_get_man: EndpointTypeInfo(
+        import_name=PDFGetManInterface,
+        custom_class="CustomPDFGetMan",
+        operation_name="pdf_get_man_operation",
+    ),
+    EndpointType.pdf_prep: EndpointTypeInfo(
+        import_name=PDFPrepInterface,
+        custom_class="CustomPDFPrep",
+        operation_name="pdf_prep_operation",
+    ),
+    EndpointType.pdf_prep_man: EndpointTypeInfo(
+        import_name=PDFPrepManInterface,
+        custom_class="CustomPDFPrepMan",
+        operation_name="pdf_prep_man_operation",
+    ),
+    EndpointType.screen: EndpointTypeInfo(
+        import_name=ScreenInterface,
+        custom_class="CustomScreen",
+        operation_name="screen_operation",
+    ),
+    EndpointType.data: EndpointTypeInfo(
+        import_name=DataInterface,
+        custom_class="CustomData",
+        operation_name="data_operation",
+    ),
 }
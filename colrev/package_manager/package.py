@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import importlib.util
+import sys
 from pathlib import Path
 from typing import Any
 
 import toml
-import zope.interface.exceptions
-from zope.interface.verify import verifyClass
 
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
@@ -18,6 +17,11 @@ import colrev.record.record
 import colrev.settings
 from colrev.constants import EndpointType
 
+try:
+    import tomllib  # Python 3.11+ (parses the bytes directly and faster than toml)
+except ImportError:  # pragma: no cover
+    tomllib = None  # type: ignore
+
 # Inspiration for package descriptions:
 # https://github.com/rstudio/reticulate/blob/
 # 9ebca7ecc028549dadb3d51d2184f9850f6f9f9d/DESCRIPTION
@@ -25,6 +29,13 @@ from colrev.constants import EndpointType
 
 ENDPOINT_OVERVIEW = colrev.package_manager.interfaces.ENDPOINT_OVERVIEW
 
+# Interface declarations do not change after the class body is executed.
+# Classes are therefore verified only once (per endpoint type).
+_VERIFIED_ENDPOINT_CLASSES: set[tuple[EndpointType, Any]] = set()
+
+# Configs (pyproject.toml) are parsed and validated only once (per package_dir)
+_VALIDATED_CONFIGS: dict[Path, dict] = {}
+
 
 class Package:
     """A Python package for CoLRev"""
@@ -34,30 +45,46 @@ class Package:
     def __init__(self, package_dir: Path) -> None:
         self.package_dir = package_dir
         self.config = self._load_config()
-        self.name = self.config["project"]["name"]
+        self.name = sys.intern(self.config["project"]["name"])
         self.version = self.config["project"]["version"]
         self.authors = self.config["project"]["authors"]
         self.license = self.config["project"]["license"]
         self.repository = self.config["project"].get("repository", "")
         self.documentation = self.config["project"].get("documentation", "")
 
-        self.status = self.config["tool"]["colrev"]["dev_status"]
-        self.colrev_doc_link = self.config["tool"]["colrev"]["colrev_doc_link"]
+        self._colrev_details = self.config["tool"]["colrev"]
+        self.status = self._colrev_details["dev_status"]
+        self.colrev_doc_link = self._colrev_details["colrev_doc_link"]
+
+        # Split the endpoint paths ("module:class") once
+        self._endpoint_module_class = {
+            endpoint_type: tuple(self.get_endpoint(endpoint_type).split(":"))
+            for endpoint_type in EndpointType
+            if self.has_endpoint(endpoint_type)
+        }
 
     def _load_config(self) -> dict:
+        if self.package_dir in _VALIDATED_CONFIGS:
+            return _VALIDATED_CONFIGS[self.package_dir]
+
         config_path = self.package_dir / "pyproject.toml"
-        if not self.package_dir.is_dir():
-            raise colrev_exceptions.MissingDependencyError(
-                f"Package {self.package_dir} not a CoLRev package "
-                "(directory does not exist)"
-            )
+        # Note: the directory is only checked if the pyproject.toml is missing
         if not config_path.is_file():
+            if not self.package_dir.is_dir():
+                raise colrev_exceptions.MissingDependencyError(
+                    f"Package {self.package_dir} not a CoLRev package "
+                    "(directory does not exist)"
+                )
             raise colrev_exceptions.MissingDependencyError(
                 f"Package {self.package_dir} not a CoLRev package "
                 "(pyproject.toml missing)"
             )
-        with open(config_path, encoding="utf-8") as file:
-            config = toml.load(file)
+        if tomllib is not None:
+            with open(config_path, "rb") as file:
+                config = tomllib.load(file)
+        else:  # pragma: no cover
+            with open(config_path, encoding="utf-8") as file:
+                config = toml.load(file)
         if "tool" not in config or "colrev" not in config["tool"]:
             raise colrev_exceptions.MissingDependencyError(
                 f"Package {self.package_dir} not a CoLRev package "
@@ -69,22 +96,32 @@ class Package:
                 f"Package {self.package_dir} not a CoLRev package "
                 "(dev_status missing in tool.colrev)"
             )
+        _VALIDATED_CONFIGS[self.package_dir] = config
         return config
 
     def has_endpoint(self, endpoint_type: EndpointType) -> bool:
         """Check if the package has a specific endpoint type"""
-        return endpoint_type.value in self.config["tool"]["colrev"]
+        return endpoint_type.value in self._colrev_details
 
     def get_endpoint(self, endpoint_type: EndpointType) -> str:
         """Get the endpoint for a package type"""
-        return self.config["tool"]["colrev"][endpoint_type.value]
+        return self._colrev_details[endpoint_type.value]
 
     def _endpoint_verified(
         self, endpoint_class: Any, endpoint_type: EndpointType, identifier: str
     ) -> bool:
-        interface_definition = ENDPOINT_OVERVIEW[endpoint_type]["import_name"]
+        if (endpoint_type, endpoint_class) in _VERIFIED_ENDPOINT_CLASSES:
+            return True
+
+        # pylint: disable=import-outside-toplevel
+        # Note: only needed when an endpoint class is loaded
+        import zope.interface.exceptions
+        from zope.interface.verify import verifyClass
+
+        interface_definition = ENDPOINT_OVERVIEW[endpoint_type].import_name
         try:
             verifyClass(interface_definition, endpoint_class)  # type: ignore
+            _VERIFIED_ENDPOINT_CLASSES.add((endpoint_type, endpoint_class))
             return True
         except zope.interface.exceptions.BrokenImplementation as exc:
             print(f"Error registering endpoint {identifier}: {exc}")
@@ -97,8 +134,7 @@ class Package:
                 f"Package {self.name} does not have a {package_type} endpoint"
             )
 
-        endpoint_path = self.get_endpoint(package_type)
-        module_name, class_name = endpoint_path.split(":")
+        module_name, class_name = self._endpoint_module_class[package_type]
         module = importlib.import_module(module_name)
         cls = getattr(module, class_name)
         if not self._endpoint_verified(cls, package_type, self.name):
@@ -112,11 +148,8 @@ class Package:
         self, type_identifier_endpoint_dict: dict
     ) -> None:
         """Add the package to the type_identifier_endpoint_dict dict"""
-        if "tool" not in self.config or "colrev" not in self.config["tool"]:
-            return
-
-        for endpoint_type in EndpointType:
-            if self.has_endpoint(endpoint_type):
-                type_identifier_endpoint_dict[endpoint_type][self.name] = (
-                    self.get_endpoint(endpoint_type)
-                )
+        # Note: _load_config() ensures that the tool.colrev section exists
+        for endpoint_type in self._endpoint_module_class:
+            type_identifier_endpoint_dict[endpoint_type][self.name] = self.get_endpoint(
+                endpoint_type
+            )
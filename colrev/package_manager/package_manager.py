@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import importlib.util
-import typing
+import os
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -16,38 +17,58 @@ from colrev.constants import EndpointType
 class PackageManager:
     """The PackageManager provides functionality for package lookup and discovery"""
 
-    def _get_package_dir(self, package_identifier: str) -> Path:
-        if package_identifier.startswith("colrev."):
-            colrev_package_module = importlib.import_module("colrev.packages")
-            if colrev_package_module.__file__:
-                colrev_package_dir = Path(colrev_package_module.__file__).parent
-                return colrev_package_dir / package_identifier[7:]
+    # Cache for endpoint classes (keyed by package_type and package_identifier)
+    # Note: shared by all instances because get_package_manager()
+    # creates a new PackageManager for each operation
+    _endpoint_classes: dict[tuple[EndpointType, str], Any] = {}
+    # The location of colrev.packages is resolved once (shared by all packages)
+    _colrev_package_dir: Path | None = None
+
+    def __init__(self) -> None:
+        # Loaded lazily (on first use) to avoid parsing all package configs
+        self._type_identifier_endpoint_dict: (
+            dict[EndpointType, dict[str, Any]] | None
+        ) = None
+
+    def _get_colrev_package_dir(self) -> Path:
+        if PackageManager._colrev_package_dir is not None:
+            return PackageManager._colrev_package_dir
+
+        # find_spec locates colrev.packages without executing the module
+        colrev_package_spec = importlib.util.find_spec("colrev.packages")
+        if colrev_package_spec is None or colrev_package_spec.origin is None:
             raise colrev_exceptions.MissingDependencyError(
                 "Could not find the colrev package"
             )
+        PackageManager._colrev_package_dir = Path(colrev_package_spec.origin).parent
+        return PackageManager._colrev_package_dir
+
+    def _get_package_dir(self, package_identifier: str) -> Path:
+        if package_identifier.startswith("colrev."):
+            return self._get_colrev_package_dir() / package_identifier[7:]
 
         raise NotImplementedError
 
     def _get_packages_dirs(self) -> list:
-        colrev_package_module = importlib.import_module("colrev.packages")
-        if colrev_package_module.__file__:
-            colrev_package_dir = Path(colrev_package_module.__file__).parent
-            # Add other packages to package_dirs later
+        colrev_package_dir = self._get_colrev_package_dir()
+        # Add other packages to package_dirs later
+        # Note: scandir provides the file type without an additional stat per entry
+        with os.scandir(colrev_package_dir) as entries:
             return [
-                package_dir
-                for package_dir in colrev_package_dir.iterdir()
-                if package_dir.is_dir() and not str(package_dir.name).startswith("__")
+                Path(entry.path)
+                for entry in entries
+                if not entry.name.startswith("__") and entry.is_dir()
             ]
-        raise colrev_exceptions.MissingDependencyError(
-            "Could not find the colrev package"
-        )
 
     def load_type_identifier_endpoint_dict(self) -> dict:
         """Load the type_identifier_endpoint_dict from the packages"""
 
-        type_identifier_endpoint_dict: typing.Dict[
-            EndpointType, typing.Dict[str, Any]
-        ] = {endpoint_type: {} for endpoint_type in EndpointType}
+        if self._type_identifier_endpoint_dict is not None:
+            return self._type_identifier_endpoint_dict
+
+        type_identifier_endpoint_dict: dict[EndpointType, dict[str, Any]] = {
+            endpoint_type: {} for endpoint_type in EndpointType
+        }
 
         for package_dir in self._get_packages_dirs():
             try:
@@ -59,6 +80,7 @@ class PackageManager:
                 print(exc)
                 continue
 
+        self._type_identifier_endpoint_dict = type_identifier_endpoint_dict
         return type_identifier_endpoint_dict
 
     def _load_python_packages(self) -> list:
@@ -93,7 +115,7 @@ class PackageManager:
         )
         doc_reg_manager.update()
 
-    def discover_packages(self, *, package_type: EndpointType) -> typing.Dict:
+    def discover_packages(self, *, package_type: EndpointType) -> dict:
         """Discover packages (for cli usage)"""
 
         type_identifier_endpoint_dict = self.load_type_identifier_endpoint_dict()
@@ -109,6 +131,12 @@ class PackageManager:
     ):
         """Load a package endpoint"""
 
+        # Interned identifiers are compared by identity in cache lookups
+        package_identifier = sys.intern(package_identifier)
+        cache_key = (package_type, package_identifier)
+        if cache_key in self._endpoint_classes:
+            return self._endpoint_classes[cache_key]
+
         if not package_identifier.startswith("colrev."):
             raise colrev_exceptions.MissingDependencyError(
                 f"{package_identifier} is not a CoLRev package"
@@ -116,4 +144,6 @@ class PackageManager:
 
         module_path = self._get_package_dir(package_identifier)
         package = colrev.package_manager.package.Package(module_path)
-        return package.get_endpoint_class(package_type)
+        endpoint_class = package.get_endpoint_class(package_type)
+        self._endpoint_classes[cache_key] = endpoint_class
+        return endpoint_class
@@ -18,6 +18,18 @@ import colrev.settings
 from colrev.constants import SearchType
 
 
+# Fields are fixed once the (dataclass) settings class is defined
+_FIELD_NAMES: dict[type, frozenset[str]] = {}
+
+
+def _get_field_names(data_class: type) -> frozenset[str]:
+    if data_class not in _FIELD_NAMES:
+        _FIELD_NAMES[data_class] = frozenset(
+            field.name for field in dataclasses.fields(data_class)
+        )
+    return _FIELD_NAMES[data_class]
+
+
 @dataclass
 class DefaultSettings(JsonSchemaMixin):
     """Endpoint settings"""
@@ -28,9 +40,8 @@ class DefaultSettings(JsonSchemaMixin):
     def load_settings(cls, *, data: dict):  # type: ignore
         """Load the settings from dict"""
 
-        required_fields = [field.name for field in dataclasses.fields(cls)]
-        available_fields = list(data.keys())
-        non_supported_fields = [f for f in available_fields if f not in required_fields]
+        required_fields = _get_field_names(cls)
+        non_supported_fields = [f for f in data if f not in required_fields]
         if non_supported_fields:
             raise colrev_exceptions.ParameterError(
                 parameter="non_supported_fields",
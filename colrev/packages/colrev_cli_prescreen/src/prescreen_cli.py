@@ -19,6 +19,9 @@ from colrev.constants import Fields
 
 # pylint: disable=too-few-public-methods
 
+# yes, no, skip/decide later, quit-and-save
+_VALID_INPUTS = frozenset({"y", "n", "s", "q"})
+
 
 @zope.interface.implementer(colrev.package_manager.interfaces.PrescreenInterface)
 @dataclass
@@ -27,6 +30,8 @@ class CoLRevCLIPrescreen(JsonSchemaMixin):
 
     settings_class = colrev.package_manager.package_settings.DefaultSettings
     ci_supported: bool = False
+    # Decisions are saved in batches (and when the prescreen is stopped)
+    _SAVE_BATCH_SIZE = 20
 
     def __init__(
         self,
@@ -71,6 +76,22 @@ class CoLRevCLIPrescreen(JsonSchemaMixin):
 
         print(ret_str)
 
+    def _get_decision(self) -> str:
+        ret = "NA"
+        while ret not in _VALID_INPUTS:
+            ret = input(
+                "\nInclude this record "
+                "[enter y,n,s,q for yes, no, skip/decide later, quit-and-save]? "
+            )
+        return ret
+
+    def _save_decisions(self, decided_records: dict) -> None:
+        # Note: one partial save (rewrite of the records file) per batch
+        if not decided_records:
+            return
+        self.review_manager.dataset.save_records_dict(decided_records, partial=True)
+        decided_records.clear()
+
     def _fun_cli_prescreen(
         self,
         *,
@@ -99,45 +120,39 @@ class CoLRevCLIPrescreen(JsonSchemaMixin):
         if 0 == stat_len:
             self.review_manager.logger.info("No records to prescreen")
 
-        i, quit_pressed = 0, False
-        for record_dict in prescreen_data["items"]:
-            if len(split) > 0:
-                if record_dict[Fields.ID] not in split:
-                    continue
+        i = 0
+        decided_records: dict = {}
+        try:
+            for record_dict in prescreen_data["items"]:
+                if len(split) > 0:
+                    if record_dict[Fields.ID] not in split:
+                        continue
 
-            record = colrev.record.record.Record(record_dict)
-            ret, inclusion_decision_str = "NA", "NA"
-            i += 1
+                record = colrev.record.record.Record(record_dict)
+                i += 1
 
-            print("\n\n")
-            print(f"Record {i} (of {stat_len})\n")
-            self._print_prescreen_record(record)
+                print("\n\n")
+                print(f"Record {i} (of {stat_len})\n")
+                self._print_prescreen_record(record)
 
-            while ret not in ["y", "n", "s", "q"]:
-                ret = input(
-                    "\nInclude this record "
-                    "[enter y,n,s,q for yes, no, skip/decide later, quit-and-save]? "
-                )
+                ret = self._get_decision()
                 if ret == "q":
-                    quit_pressed = True
-                elif ret == "s":
+                    self.review_manager.logger.info("Stop prescreen")
+                    break
+                if ret == "s":
                     continue
-                else:
-                    inclusion_decision_str = ret.replace("y", "yes").replace("n", "no")
-
-            if quit_pressed:
-                self.review_manager.logger.info("Stop prescreen")
-                break
-
-            if ret == "s":
-                continue
 
-            inclusion_decision = "yes" == inclusion_decision_str
-            self.prescreen_operation.prescreen(
-                record=record,
-                prescreen_inclusion=inclusion_decision,
-                PAD=padding,
-            )
+                self.prescreen_operation.prescreen(
+                    record=record,
+                    prescreen_inclusion=ret == "y",
+                    PAD=padding,
+                    save=False,
+                )
+                decided_records[record.data[Fields.ID]] = record.get_data()
+                if len(decided_records) >= self._SAVE_BATCH_SIZE:
+                    self._save_decisions(decided_records)
+        finally:
+            self._save_decisions(decided_records)
 
         return i == stat_len
 
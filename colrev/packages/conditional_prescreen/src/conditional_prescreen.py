@@ -43,13 +43,11 @@ class ConditionalPrescreen(JsonSchemaMixin):
     ) -> dict:
         """Prescreen records based on predefined conditions (rules)"""
 
-        pad = 50
         for record in records.values():
             if record[Fields.STATUS] != RecordState.md_processed:
                 continue
             self.review_manager.report_logger.info(
-                f" {record[Fields.ID]}".ljust(pad, " ")
-                + "Included in prescreen (automatically)"
+                f" {record[Fields.ID]:<49}Included in prescreen (automatically)"
             )
             # pylint: disable=colrev-direct-status-assign
             record.update(colrev_status=RecordState.rev_prescreen_included)
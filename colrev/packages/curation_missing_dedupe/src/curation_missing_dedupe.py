@@ -2,6 +2,7 @@
 """Deduplication of remaining records in curated metadata repositories"""
 from __future__ import annotations
 
+import heapq
 import typing
 from dataclasses import dataclass
 from pathlib import Path
@@ -10,12 +11,14 @@ import pandas as pd
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
 
+import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
 import colrev.package_manager.package_settings
 import colrev.record.record
-import colrev.record.record_prep
+import colrev.record.record_identifier
+import colrev.record.record_similarity
 from colrev.constants import Colors
 from colrev.constants import Fields
 from colrev.constants import RecordState
@@ -25,6 +28,31 @@ from colrev.constants import RecordState
 # pylint: disable=too-few-public-methods
 # pylint: disable=duplicate-code
 
+# Records that are not yet curated (candidates are only shown for curated records)
+_NON_CURATED_STATES = frozenset(
+    {
+        RecordState.md_prepared,
+        RecordState.md_needs_manual_preparation,
+        RecordState.md_imported,
+    }
+)
+
+# Columns exported for records that are not fully merged (and the TOC columns)
+_EXPORT_FIELDS = frozenset(
+    {
+        Fields.ID,
+        Fields.STATUS,
+        Fields.JOURNAL,
+        Fields.BOOKTITLE,
+        Fields.YEAR,
+        Fields.VOLUME,
+        Fields.NUMBER,
+        Fields.TITLE,
+        Fields.AUTHOR,
+    }
+)
+_TOC_FIELDS = (Fields.YEAR, Fields.VOLUME, Fields.NUMBER)
+
 
 @zope.interface.implementer(colrev.package_manager.interfaces.DedupeInterface)
 @dataclass
@@ -48,9 +76,7 @@ class CurationMissingDedupe(JsonSchemaMixin):
             state=RecordState.md_processed
         )
 
-    def _create_dedupe_source_stats(self) -> None:
-        # Note : reload to generate correct statistics
-
+    def _create_dedupe_source_stats(self, *, records: dict) -> None:
         Path("dedupe").mkdir(exist_ok=True)
 
         source_origins = [
@@ -58,67 +84,67 @@ class CurationMissingDedupe(JsonSchemaMixin):
             for source in self.review_manager.settings.sources
         ]
 
-        records = self.review_manager.dataset.load_records_dict()
+        # Note: the records are assigned to the sources in one pass.
+        # The origins are joined once per record: source_origin (no line break)
+        # is in the joined string if and only if it is in one of the origins.
+        source_records: typing.Dict[str, list] = {s: [] for s in source_origins}
+        for record_dict in records.values():
+            if record_dict[Fields.STATUS] not in _NON_CURATED_STATES:
+                continue
+            origins = "\n".join(record_dict[Fields.ORIGIN])
+            for source_origin, selected_records in source_records.items():
+                if source_origin in origins:
+                    selected_records.append(record_dict)
+
         for source_origin in source_origins:
-            selected_records = [
-                r
-                for r in records.values()
-                if any(source_origin in co for co in r[Fields.ORIGIN])
-                and r[Fields.STATUS]
-                in [
-                    RecordState.md_prepared,
-                    RecordState.md_needs_manual_preparation,
-                    RecordState.md_imported,
-                ]
-            ]
-            records_df = pd.DataFrame.from_records(list(selected_records))
-            if records_df.shape[0] == 0:
+            selected_records = source_records[source_origin]
+            # Note: the DataFrame is only created if there are records to export
+            if not selected_records:
                 self.review_manager.logger.info(
                     f"{Colors.GREEN}Source {source_origin} fully merged{Colors.END}"
                 )
-            else:
-                self.review_manager.logger.info(
-                    f"{Colors.ORANGE}Source {source_origin} not fully merged{Colors.END}"
-                )
-                self.review_manager.logger.info(
-                    f"Exporting details to dedupe/{source_origin}.xlsx"
+                continue
+
+            self.review_manager.logger.info(
+                f"{Colors.ORANGE}Source {source_origin} not fully merged{Colors.END}"
+            )
+            self.review_manager.logger.info(
+                f"Exporting details to dedupe/{source_origin}.xlsx"
+            )
+
+            records_df = pd.DataFrame.from_records(selected_records)
+            # Note: the columns are selected once (keeping the order of the DataFrame)
+            columns = [c for c in records_df.columns if c in _EXPORT_FIELDS]
+            records_df = records_df[columns]
+            keys = [c for c in _TOC_FIELDS if c in columns]
+            if keys:
+                records_df[keys] = records_df[keys].apply(
+                    pd.to_numeric, errors="coerce"
                 )
+            records_df.sort_values(by=keys, inplace=True)
+            colrev.env.utils.save_df_to_xlsx(
+                data_frame=records_df, path=Path(f"dedupe/{source_origin}.xlsx")
+            )
 
-                records_df = records_df[
-                    records_df.columns.intersection(
-                        [
-                            Fields.ID,
-                            Fields.STATUS,
-                            Fields.JOURNAL,
-                            Fields.BOOKTITLE,
-                            Fields.YEAR,
-                            Fields.VOLUME,
-                            Fields.NUMBER,
-                            Fields.TITLE,
-                            Fields.AUTHOR,
-                        ]
-                    )
-                ]
-                keys = list(
-                    records_df.columns.intersection(
-                        [Fields.YEAR, Fields.VOLUME, Fields.NUMBER]
+    def _get_toc_index(self, *, records: dict) -> typing.Dict[str, list]:
+        # Note: the toc_keys are computed once (instead of once per record pair)
+        toc_index: typing.Dict[str, list] = {}
+        for record_candidate in records.values():
+            if record_candidate[Fields.STATUS] in _NON_CURATED_STATES:
+                continue
+            try:
+                candidate_toc_key = (
+                    colrev.record.record_identifier.get_toc_key_from_dict(
+                        record_candidate
                     )
                 )
-                if Fields.YEAR in keys:
-                    records_df.year = pd.to_numeric(records_df.year, errors="coerce")
-                if Fields.VOLUME in keys:
-                    records_df.volume = pd.to_numeric(
-                        records_df.volume, errors="coerce"
-                    )
-                if Fields.NUMBER in keys:
-                    records_df.number = pd.to_numeric(
-                        records_df.number, errors="coerce"
-                    )
-                records_df.sort_values(by=keys, inplace=True)
-                records_df.to_excel(f"dedupe/{source_origin}.xlsx", index=False)
+            except colrev_exceptions.NotTOCIdentifiableException:
+                continue
+            toc_index.setdefault(candidate_toc_key, []).append(record_candidate)
+        return toc_index
 
     def _get_same_toc_recs(
-        self, *, record: colrev.record.record.Record, records: dict
+        self, *, record: colrev.record.record.Record, toc_index: dict
     ) -> list:
         if self.review_manager.force_mode:
             if record.data[Fields.STATUS] in self._post_md_prepared_states:
@@ -135,56 +161,39 @@ class CurationMissingDedupe(JsonSchemaMixin):
         except colrev_exceptions.NotTOCIdentifiableException:
             return []
 
-        same_toc_recs = []
-        for record_candidate in records.values():
-            try:
-                candidate_toc_key = colrev.record.record.Record(
-                    record_candidate
-                ).get_toc_key()
-            except colrev_exceptions.NotTOCIdentifiableException:
-                continue
-            if toc_key != candidate_toc_key:
-                continue
-            if record_candidate[Fields.ID] == record.data[Fields.ID]:
-                continue
-            if record_candidate[Fields.STATUS] in [
-                RecordState.md_prepared,
-                RecordState.md_needs_manual_preparation,
-                RecordState.md_imported,
-            ]:
-                continue
-            same_toc_recs.append(record_candidate)
-        return same_toc_recs
+        return [
+            record_candidate
+            for record_candidate in toc_index.get(toc_key, [])
+            if record_candidate[Fields.ID] != record.data[Fields.ID]
+        ]
 
     def _print_same_toc_recs(
         self, *, same_toc_recs: list, record: colrev.record.record.Record
     ) -> list:
-        for same_toc_rec in same_toc_recs:
-            same_toc_rec["similarity"] = (
-                colrev.record.record_prep.PrepRecord.get_record_similarity(
-                    colrev.record.record.Record(same_toc_rec), record
-                )
-            )
-
-        same_toc_recs = sorted(
-            same_toc_recs, key=lambda d: d["similarity"], reverse=True
+        # Note: the record is prepared once for all same_toc_recs
+        # Similarities are not stored in the record dicts (which may be saved)
+        similarities = colrev.record.record_similarity.get_record_similarities(
+            record, [colrev.record.record.Record(r) for r in same_toc_recs]
+        )
+        # Note: only the 20 most similar records are displayed
+        # (nlargest keeps the order of sorted(..., reverse=True)[:20])
+        ranked_recs = heapq.nlargest(
+            20, zip(similarities, same_toc_recs), key=lambda x: x[0]
         )
-        if len(same_toc_recs) > 20:
-            same_toc_recs = same_toc_recs[0:20]
 
         i = 0
-        for i, same_toc_rec in enumerate(same_toc_recs):
+        for i, (similarity, same_toc_rec) in enumerate(ranked_recs):
             author_title_string = (
                 f"{same_toc_rec.get('author', 'NO_AUTHOR')} : "
                 + f"{same_toc_rec.get('title', 'NO_TITLE')}"
             )
 
-            if same_toc_rec["similarity"] > 0.8:
+            if similarity > 0.8:
                 print(f"{i + 1} - {Colors.ORANGE}{author_title_string}{Colors.END}")
 
             else:
                 print(f"{i + 1} - {author_title_string}")
-        return same_toc_recs
+        return [same_toc_rec for _, same_toc_rec in ranked_recs]
 
     def _get_nr_recs_to_merge(self, *, records: dict) -> int:
         if self.review_manager.force_mode:
@@ -209,9 +218,7 @@ class CurationMissingDedupe(JsonSchemaMixin):
             )
         return nr_recs_to_merge
 
-    def _process_missing_duplicates(self) -> dict:
-        records = self.review_manager.dataset.load_records_dict()
-
+    def _process_missing_duplicates(self, *, records: dict) -> dict:
         nr_recs_to_merge = self._get_nr_recs_to_merge(records=records)
 
         nr_recs_checked = 0
@@ -221,10 +228,11 @@ class CurationMissingDedupe(JsonSchemaMixin):
             "records_to_prepare": [],
         }
 
+        toc_index = self._get_toc_index(records=records)
         for record_dict in records.values():
             record = colrev.record.record.Record(record_dict)
 
-            same_toc_recs = self._get_same_toc_recs(record=record, records=records)
+            same_toc_recs = self._get_same_toc_recs(record=record, toc_index=toc_index)
 
             if len(same_toc_recs) == 0:
                 print("no same toc records")
@@ -302,7 +310,10 @@ class CurationMissingDedupe(JsonSchemaMixin):
         )
         print("\n\n")
 
-        ret = self._process_missing_duplicates()
+        # Note: the records are only reloaded when they were changed on disk
+        # (by apply_merges or by the user)
+        records = self.review_manager.dataset.load_records_dict()
+        ret = self._process_missing_duplicates(records=records)
 
         if len(ret["decision_list"]) > 0:
             print("Duplicates identified:")
@@ -317,11 +328,13 @@ class CurationMissingDedupe(JsonSchemaMixin):
                 id_sets=ret["decision_list"],
                 preferred_masterdata_sources=preferred_masterdata_sources,
             )
+            records = self.review_manager.dataset.load_records_dict()
 
         if len(ret["records_to_prepare"]) > 0:
-            records = self.review_manager.dataset.load_records_dict()
-            for record_id, record_dict in records.items():
-                if record_id in ret["records_to_prepare"]:
+            # Note: only the selected records are visited (not all records)
+            for record_id in ret["records_to_prepare"]:
+                record_dict = records.get(record_id)
+                if record_dict:
                     record = colrev.record.record.Record(record_dict)
                     record.set_status(
                         target_state=RecordState.md_needs_manual_preparation
@@ -335,16 +348,11 @@ class CurationMissingDedupe(JsonSchemaMixin):
             )
 
         if len(ret["add_records_to_md_processed_list"]) > 0:
-            records = self.review_manager.dataset.load_records_dict()
-            for record_id, record_dict in records.items():
-                if record_id in ret["add_records_to_md_processed_list"]:
-                    if record_dict[Fields.STATUS] in [
-                        RecordState.md_prepared,
-                        RecordState.md_needs_manual_preparation,
-                        RecordState.md_imported,
-                    ]:
-                        record = colrev.record.record.Record(record_dict)
-                        record.set_status(RecordState.md_processed)
+            for record_id in ret["add_records_to_md_processed_list"]:
+                record_dict = records.get(record_id)
+                if record_dict and record_dict[Fields.STATUS] in _NON_CURATED_STATES:
+                    record = colrev.record.record.Record(record_dict)
+                    record.set_status(RecordState.md_processed)
 
             self.review_manager.dataset.save_records_dict(records)
             input("Edit records (if any), add to git, and press Enter")
@@ -352,5 +360,7 @@ class CurationMissingDedupe(JsonSchemaMixin):
             self.review_manager.dataset.create_commit(
                 msg="Add non-duplicate records",
             )
+            # Note : reload to generate correct statistics (after manual edits)
+            records = self.review_manager.dataset.load_records_dict()
 
-        self._create_dedupe_source_stats()
+        self._create_dedupe_source_stats(records=records)
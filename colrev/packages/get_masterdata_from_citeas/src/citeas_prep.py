@@ -20,6 +20,15 @@ from colrev.constants import Fields
 # pylint: disable=too-few-public-methods
 # pylint: disable=duplicate-code
 
+# CiteAs metadata keys that are copied to record fields (in this order)
+_CITEAS_FIELDS = (
+    ("URL", Fields.URL),
+    ("note", "note"),
+    ("type", Fields.ENTRYTYPE),
+    (Fields.YEAR, Fields.YEAR),
+    ("DOI", Fields.DOI),
+)
+
 
 @zope.interface.implementer(colrev.package_manager.interfaces.PrepInterface)
 @dataclass
@@ -58,29 +67,23 @@ class CiteAsPrep(JsonSchemaMixin):
         retrieved_record: dict = {}
         data = json.loads(json_str)
 
-        if Fields.AUTHOR in data["metadata"]:
-            authors = data["metadata"][Fields.AUTHOR]
-            authors_string = ""
-            for author in authors:
-                authors_string += author.get("family", "") + ", "
-                authors_string += author.get("given", "") + " "
-            authors_string = authors_string.lstrip().rstrip().replace("  ", " ")
+        metadata = data["metadata"]
+        if Fields.AUTHOR in metadata:
+            authors = metadata[Fields.AUTHOR]
+            authors_string = "".join(
+                f"{author.get('family', '')}, {author.get('given', '')} "
+                for author in authors
+            )
+            authors_string = authors_string.strip().replace("  ", " ")
             retrieved_record.update(author=authors_string)
-        if "container-title" in data["metadata"]:
-            container_title = data["metadata"]["container-title"]
-            if isinstance(data["metadata"]["container-title"], list):
-                container_title = "".join(data["metadata"]["container-title"])
+        if "container-title" in metadata:
+            container_title = metadata["container-title"]
+            if isinstance(container_title, list):
+                container_title = "".join(container_title)
             retrieved_record.update(title=container_title)
-        if "URL" in data["metadata"]:
-            retrieved_record.update(url=data["metadata"]["URL"])
-        if "note" in data["metadata"]:
-            retrieved_record.update(note=data["metadata"]["note"])
-        if "type" in data["metadata"]:
-            retrieved_record.update(ENTRYTYPE=data["metadata"]["type"])
-        if Fields.YEAR in data["metadata"]:
-            retrieved_record.update(year=data["metadata"][Fields.YEAR])
-        if "DOI" in data["metadata"]:
-            retrieved_record.update(doi=data["metadata"]["DOI"])
+        for citeas_key, field in _CITEAS_FIELDS:
+            if citeas_key in metadata:
+                retrieved_record[field] = metadata[citeas_key]
 
         record = colrev.record.record_prep.PrepRecord(retrieved_record)
         record.add_provenance_all(source=url)
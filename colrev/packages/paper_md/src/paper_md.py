@@ -661,13 +661,12 @@ class PaperMarkdown(JsonSchemaMixin):
 
         write_file(records_dict=records, filename=self.sample_references)
 
-    def _call_docker_build_process(self, *, script: str) -> None:
+    def _call_docker_build_process(self, *, script: typing.List[str]) -> None:
         try:
-            uid = os.stat(self.review_manager.paths.records).st_uid
-            gid = os.stat(self.review_manager.paths.records).st_gid
-            user = f"{uid}:{gid}"
+            records_stat = os.stat(self.review_manager.paths.records)
+            user = f"{records_stat.st_uid}:{records_stat.st_gid}"
 
-            client = docker.from_env()
+            client = colrev.env.docker_manager.DockerManager.get_client()
             msg = f"Running docker container created from image {self.pandoc_image}"
             self.review_manager.report_logger.info(msg)
 
@@ -718,9 +717,10 @@ class PaperMarkdown(JsonSchemaMixin):
             self.review_manager.path
         )
 
+        # Note: the (cheap) file check runs before the git diff in has_changes()
         if (
-            not self.review_manager.dataset.has_changes(self.paper_relative_path)
-            and self.settings.paper_output.is_file()
+            self.settings.paper_output.is_file()
+            and not self.review_manager.dataset.has_changes(self.paper_relative_path)
         ):
             self.review_manager.logger.debug("Skipping paper build (no changes)")
             return
@@ -728,11 +728,17 @@ class PaperMarkdown(JsonSchemaMixin):
         if self.review_manager.verbose_mode:
             self.review_manager.logger.info("Build paper")
 
-        script = (
-            f"{self.paper_relative_path} --filter pandoc-crossref --citeproc "
-            + f"--reference-doc {word_template.relative_to(self.review_manager.path)} "
-            + f"--output {output_relative_path}"
-        )
+        # Note: the arguments are passed as a list (no splitting of the command string)
+        script = [
+            str(self.paper_relative_path),
+            "--filter",
+            "pandoc-crossref",
+            "--citeproc",
+            "--reference-doc",
+            str(word_template.relative_to(self.review_manager.path)),
+            "--output",
+            str(output_relative_path),
+        ]
 
         Timer(
             1,
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import csv
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
 
+import colrev.env.utils
+import colrev.exceptions as colrev_exceptions
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
 import colrev.package_manager.package_settings
@@ -18,10 +22,54 @@ from colrev.constants import Colors
 from colrev.constants import Fields
 from colrev.constants import RecordState
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
+
 
 # pylint: disable=too-few-public-methods
 # pylint: disable=duplicate-code
 
+_EXPORT_STATES = [
+    RecordState.md_processed,
+    RecordState.rev_prescreen_excluded,
+    RecordState.rev_prescreen_included,
+    RecordState.pdf_needs_manual_retrieval,
+    RecordState.pdf_imported,
+    RecordState.pdf_not_available,
+    RecordState.pdf_needs_manual_preparation,
+    RecordState.pdf_prepared,
+    RecordState.rev_excluded,
+    RecordState.rev_included,
+    RecordState.rev_synthesized,
+]
+_EXPORT_FIELDS = [
+    Fields.ID,
+    Fields.AUTHOR,
+    Fields.TITLE,
+    Fields.JOURNAL,
+    Fields.BOOKTITLE,
+    Fields.YEAR,
+    Fields.VOLUME,
+    Fields.NUMBER,
+    Fields.PAGES,
+    Fields.DOI,
+    Fields.ABSTRACT,
+]
+# Decisions in the presceen_inclusion column
+_PRESCREEN_DECISIONS = {
+    "in": RecordState.rev_prescreen_included,
+    "out": RecordState.rev_prescreen_excluded,
+}
+
+_IMPORT_COLUMNS = frozenset({Fields.ID, "presceen_inclusion"})
+
+
+def _is_import_column(column: str) -> bool:
+    return column in _IMPORT_COLUMNS
+
 
 @zope.interface.implementer(colrev.package_manager.interfaces.PrescreenInterface)
 @dataclass
@@ -57,63 +105,49 @@ class TablePrescreen(JsonSchemaMixin):
 
         self.review_manager.logger.info("Loading records for export")
 
-        tbl = []
-        for record in records.values():
-            if record[Fields.STATUS] not in [
-                RecordState.md_processed,
-                RecordState.rev_prescreen_excluded,
-                RecordState.rev_prescreen_included,
-                RecordState.pdf_needs_manual_retrieval,
-                RecordState.pdf_imported,
-                RecordState.pdf_not_available,
-                RecordState.pdf_needs_manual_preparation,
-                RecordState.pdf_prepared,
-                RecordState.rev_excluded,
-                RecordState.rev_included,
-                RecordState.rev_synthesized,
-            ]:
-                continue
-
-            if len(split) > 0:
-                if record[Fields.ID] not in split:
-                    continue
-
-            if RecordState.md_processed == record[Fields.STATUS]:
-                inclusion_1 = "TODO"
-            elif self.export_todos_only:
-                continue
-            elif RecordState.rev_prescreen_excluded == record[Fields.STATUS]:
-                inclusion_1 = "out"
-            else:
-                inclusion_1 = "in"
-
-            # pylint: disable=duplicate-code
-            row = {
-                Fields.ID: record[Fields.ID],
-                Fields.AUTHOR: record.get(Fields.AUTHOR, ""),
-                Fields.TITLE: record.get(Fields.TITLE, ""),
-                Fields.JOURNAL: record.get(Fields.JOURNAL, ""),
-                Fields.BOOKTITLE: record.get(Fields.BOOKTITLE, ""),
-                Fields.YEAR: record.get(Fields.YEAR, ""),
-                Fields.VOLUME: record.get(Fields.VOLUME, ""),
-                Fields.NUMBER: record.get(Fields.NUMBER, ""),
-                Fields.PAGES: record.get(Fields.PAGES, ""),
-                Fields.DOI: record.get(Fields.DOI, ""),
-                Fields.ABSTRACT: record.get(Fields.ABSTRACT, ""),
-                "presceen_inclusion": inclusion_1,
-            }
-            tbl.append(row)
+        # Note: the records are converted to a DataFrame once
+        # (only the exported fields are extracted) and selected in vectorized steps
+        records_df = pd.DataFrame(
+            list(records.values()), columns=[Fields.STATUS] + _EXPORT_FIELDS
+        )
+        selected = records_df[Fields.STATUS].isin(_EXPORT_STATES)
+        if len(split) > 0:
+            selected &= records_df[Fields.ID].isin(split)
+        if self.export_todos_only:
+            selected &= records_df[Fields.STATUS] == RecordState.md_processed
+
+        screen_df = records_df.loc[selected, _EXPORT_FIELDS].fillna("")
+        statuses = records_df.loc[selected, Fields.STATUS].to_numpy()
+        screen_df["presceen_inclusion"] = np.select(
+            [
+                statuses == RecordState.md_processed,
+                statuses == RecordState.rev_prescreen_excluded,
+            ],
+            ["TODO", "out"],
+            default="in",
+        )
 
         if export_table_format.lower() == "csv":
-            screen_df = pd.DataFrame(tbl)
-            screen_df.to_csv("prescreen.csv", index=False, quoting=csv.QUOTE_ALL)
+            self._export_to_csv(screen_df=screen_df, path=Path("prescreen.csv"))
             self.review_manager.logger.info("Created prescreen.csv")
 
         if export_table_format.lower() == "xlsx":
-            screen_df = pd.DataFrame(tbl)
-            screen_df.to_excel("prescreen.xlsx", index=False, sheet_name="screen")
+            colrev.env.utils.save_df_to_xlsx(
+                data_frame=screen_df, path=Path("prescreen.xlsx"), sheet_name="screen"
+            )
             self.review_manager.logger.info("Created prescreen.xlsx")
 
+        # Note: feather and parquet (binary, columnar) require pyarrow
+        if export_table_format.lower() == "feather":
+            self._check_pyarrow()
+            screen_df.reset_index(drop=True).to_feather("prescreen.feather")
+            self.review_manager.logger.info("Created prescreen.feather")
+
+        if export_table_format.lower() == "parquet":
+            self._check_pyarrow()
+            screen_df.to_parquet("prescreen.parquet", compression="zstd", index=False)
+            self.review_manager.logger.info("Created prescreen.parquet")
+
         self.review_manager.logger.info(
             f"To prescreen records, {Colors.ORANGE}enter [in|out] "
             f"in the presceen_inclusion column.{Colors.END}"
@@ -123,6 +157,30 @@ class TablePrescreen(JsonSchemaMixin):
             f"prescreen.{export_table_format.lower()}{Colors.END}"
         )
 
+    def _check_pyarrow(self) -> None:
+        if pa is None:
+            raise colrev_exceptions.MissingDependencyError(
+                "pyarrow is required for feather and parquet tables "
+                "(pip install pyarrow)"
+            )
+
+    def _export_to_csv(self, *, screen_df: pd.DataFrame, path: Path) -> None:
+        # Note: the pyarrow writer (optional) is vectorized over the columns.
+        # It always ends lines with "\n" (pandas uses os.linesep).
+        if pa is not None and os.linesep == "\n":
+            try:
+                table = pa.Table.from_pandas(screen_df, preserve_index=False)
+            except pa.ArrowException:
+                pass  # e.g., mixed types in a column
+            else:
+                pa_csv.write_csv(
+                    table,
+                    path,
+                    write_options=pa_csv.WriteOptions(quoting_style="all_valid"),
+                )
+                return
+        screen_df.to_csv(path, index=False, quoting=csv.QUOTE_ALL)
+
     def import_table(
         self,
         *,
@@ -142,66 +200,69 @@ class TablePrescreen(JsonSchemaMixin):
             )
             return
 
+        # Note: only the ID and presceen_inclusion columns are parsed (csv/xlsx)
         if import_table_path.endswith(".csv"):
-            prescreen_df = pd.read_csv(import_table_path)
+            prescreen_df = pd.read_csv(import_table_path, usecols=_is_import_column)
         elif import_table_path.endswith(".xlsx") or import_table_path.endswith(".xls"):
-            prescreen_df = pd.read_excel(import_table_path)
+            prescreen_df = pd.read_excel(import_table_path, usecols=_is_import_column)
+        elif import_table_path.endswith(".feather"):
+            self._check_pyarrow()
+            prescreen_df = pd.read_feather(import_table_path)
+        elif import_table_path.endswith(".parquet"):
+            self._check_pyarrow()
+            prescreen_df = pd.read_parquet(import_table_path)
         else:
             raise ValueError(f"Unsupported file format: {import_table_path}")
-        prescreen_df.fillna("", inplace=True)
-        prescreened_records = prescreen_df.to_dict("records")
 
-        if "presceen_inclusion" not in prescreened_records[0]:
+        if "presceen_inclusion" not in prescreen_df.columns:
             self.review_manager.logger.warning("presceen_inclusion column missing")
             return
+        if Fields.ID not in prescreen_df.columns:
+            self.review_manager.logger.warning("ID column missing")
+            return
+        prescreen_df.fillna("", inplace=True)
 
-        prescreen_included = 0
-        prescreen_excluded = 0
+        nr_changed = {state: 0 for state in _PRESCREEN_DECISIONS.values()}
         nr_todo = 0
+        # Note: the post-prescreen states are determined once (not once per record)
+        post_prescreen_states = RecordState.get_post_x_states(
+            state=RecordState.rev_prescreen_included
+        )
         self.review_manager.logger.info("Update prescreen results")
-        for prescreened_record in prescreened_records:
-            if prescreened_record.get(Fields.ID, "") in records:
-                record = colrev.record.record.Record(
-                    records[prescreened_record.get(Fields.ID, "")]
-                )
-                if record.data[Fields.STATUS] in RecordState.get_post_x_states(
-                    state=RecordState.rev_prescreen_included
+        for record_id, inclusion in zip(
+            prescreen_df[Fields.ID], prescreen_df["presceen_inclusion"]
+        ):
+            if record_id not in records:
+                self.review_manager.logger.warning(f"ID not in records: {record_id}")
+                continue
+            record = colrev.record.record.Record(records[record_id])
+            if record.data[Fields.STATUS] in post_prescreen_states:
+                if (
+                    "in" == inclusion
+                    and RecordState.rev_prescreen_excluded != record.data[Fields.STATUS]
                 ):
-                    if (
-                        "in" == prescreened_record.data.get("presceen_inclusion", "")
-                        and RecordState.rev_prescreen_excluded
-                        != record.data[Fields.STATUS]
-                    ):
-                        continue
-
-                if prescreened_record.get("presceen_inclusion", "") == "out":
-                    if record.data[Fields.STATUS] != RecordState.rev_prescreen_excluded:
-                        prescreen_excluded += 1
-                    record.set_status(RecordState.rev_prescreen_excluded)
-
-                elif prescreened_record.get("presceen_inclusion", "") == "in":
-                    if record.data[Fields.STATUS] != RecordState.rev_prescreen_included:
-                        prescreen_included += 1
-                    record.set_status(RecordState.rev_prescreen_included)
-                elif prescreened_record.get("presceen_inclusion", "") == "TODO":
-                    nr_todo += 1
-                else:
-                    self.review_manager.logger.warning(
-                        "Invalid value in prescreen_inclusion: "
-                        f"{prescreened_record.get('presceen_inclusion', '')} "
-                        f"({prescreened_record.get('ID', 'NO_ID')})"
-                    )
+                    continue
 
+            target_state = _PRESCREEN_DECISIONS.get(inclusion)
+            if target_state is not None:
+                if record.data[Fields.STATUS] != target_state:
+                    nr_changed[target_state] += 1
+                record.set_status(target_state)
+            elif inclusion == "TODO":
+                nr_todo += 1
             else:
                 self.review_manager.logger.warning(
-                    f"ID not in records: {prescreened_record.get('ID', '')}"
+                    "Invalid value in prescreen_inclusion: "
+                    f"{inclusion} ({record_id})"
                 )
 
         self.review_manager.logger.info(
-            f" {Colors.GREEN}{prescreen_included} records prescreen_included{Colors.END}"
+            f" {Colors.GREEN}{nr_changed[RecordState.rev_prescreen_included]} "
+            f"records prescreen_included{Colors.END}"
         )
         self.review_manager.logger.info(
-            f" {Colors.RED}{prescreen_excluded} records prescreen_excluded{Colors.END}"
+            f" {Colors.RED}{nr_changed[RecordState.rev_prescreen_excluded]} "
+            f"records prescreen_excluded{Colors.END}"
         )
 
         self.review_manager.logger.info(
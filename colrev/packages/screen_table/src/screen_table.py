@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import csv
+import os
+import re
 import typing
 from dataclasses import dataclass
 from pathlib import Path
@@ -20,6 +22,34 @@ import colrev.settings
 from colrev.constants import Fields
 from colrev.constants import RecordState
 
+# Pairs of criterion_name=decision (separated by ";")
+_SCREENING_CRITERION = re.compile(r"([^;=]+)=([^;]*)")
+_EXPORT_FIELDS = [
+    Fields.ID,
+    Fields.AUTHOR,
+    Fields.TITLE,
+    Fields.JOURNAL,
+    Fields.BOOKTITLE,
+    Fields.YEAR,
+    Fields.VOLUME,
+    Fields.NUMBER,
+    Fields.PAGES,
+    Fields.DOI,
+    Fields.ABSTRACT,
+]
+# Values of the screen_inclusion column (per exported state)
+_SCREEN_INCLUSION = {
+    RecordState.pdf_prepared: "TODO",
+    RecordState.rev_excluded: "out",
+    RecordState.rev_included: "in",
+    RecordState.rev_synthesized: "in",
+}
+# Decisions in the screen_inclusion column
+_SCREEN_DECISIONS = {
+    "in": RecordState.rev_included,
+    "out": RecordState.rev_excluded,
+}
+
 
 @zope.interface.implementer(colrev.package_manager.interfaces.ScreenInterface)
 @dataclass
@@ -42,72 +72,50 @@ class TableScreen(JsonSchemaMixin):
         self.screen_operation = screen_operation
         self.settings = self.settings_class.load_settings(data=settings)
 
-    def _create_screening_table(self, *, records: dict, split: list) -> list:
-        # pylint: disable=too-many-branches
-        self.review_manager.logger.info("Loading records for export")
-
-        screening_criteria = util_cli_screen.get_screening_criteria_from_user_input(
-            screen_operation=self.screen_operation, records=records
-        )
+    def _get_screening_table_fields(self, *, screening_criteria: dict) -> list:
+        if len(screening_criteria) == 0:
+            return _EXPORT_FIELDS + ["screen_inclusion"]
+        return _EXPORT_FIELDS + list(screening_criteria)
 
-        tbl = []
+    def _create_screening_table(
+        self, *, records: dict, split: list, screening_criteria: dict
+    ) -> typing.Iterator[list]:
         for record in records.values():
-            if record[Fields.STATUS] not in [
-                RecordState.pdf_prepared,
-            ]:
+            status = record[Fields.STATUS]
+            if status not in _SCREEN_INCLUSION:
                 continue
 
             if len(split) > 0:
                 if record[Fields.ID] not in split:
                     continue
 
-            inclusion_2 = "NA"
-
-            if RecordState.pdf_prepared == record[Fields.STATUS]:
-                inclusion_2 = "TODO"
-            elif self.export_todos_only:
+            if self.export_todos_only and status != RecordState.pdf_prepared:
                 continue
-            if RecordState.rev_excluded == record[Fields.STATUS]:
-                inclusion_2 = "out"
-            if record[Fields.STATUS] in [
-                RecordState.rev_included,
-                RecordState.rev_synthesized,
-            ]:
-                inclusion_2 = "in"
-
-            # pylint: disable=duplicate-code
-            row = {
-                Fields.ID: record[Fields.ID],
-                Fields.AUTHOR: record.get(Fields.AUTHOR, ""),
-                Fields.TITLE: record.get(Fields.TITLE, ""),
-                Fields.JOURNAL: record.get(Fields.JOURNAL, ""),
-                Fields.BOOKTITLE: record.get(Fields.BOOKTITLE, ""),
-                Fields.YEAR: record.get(Fields.YEAR, ""),
-                Fields.VOLUME: record.get(Fields.VOLUME, ""),
-                Fields.NUMBER: record.get(Fields.NUMBER, ""),
-                Fields.PAGES: record.get(Fields.PAGES, ""),
-                Fields.DOI: record.get(Fields.DOI, ""),
-                Fields.ABSTRACT: record.get(Fields.ABSTRACT, ""),
-            }
+            inclusion_2 = _SCREEN_INCLUSION[status]
+
+            # Note: the rows are lists aligned with _get_screening_table_fields()
+            row = [record.get(field, "") for field in _EXPORT_FIELDS]
 
             if len(screening_criteria) == 0:
                 # No criteria: code inclusion directly
-                row["screen_inclusion"] = inclusion_2
+                row.append(inclusion_2)
 
             else:
                 # Code criteria
                 screening_criteria_field = record.get(Fields.SCREENING_CRITERIA, "")
                 if screening_criteria_field == "":
                     # and inclusion_2 == "in"
-                    for criterion_name in screening_criteria.keys():
-                        row[criterion_name] = "TODO (in/out)"
+                    row.extend(["TODO (in/out)"] * len(screening_criteria))
                 else:
-                    for criterion_name, decision in screening_criteria_field.split(";"):
-                        row[criterion_name] = decision
-
-            tbl.append(row)
+                    decisions = dict(
+                        _SCREENING_CRITERION.findall(screening_criteria_field)
+                    )
+                    row.extend(
+                        decisions.get(criterion_name, "")
+                        for criterion_name in screening_criteria
+                    )
 
-        return tbl
+            yield row
 
     def export_table(
         self,
@@ -126,17 +134,35 @@ class TableScreen(JsonSchemaMixin):
             print("File already exists. Please rename it.")
             return
 
-        tbl = self._create_screening_table(records=records, split=split)
+        self.review_manager.logger.info("Loading records for export")
+
+        screening_criteria = util_cli_screen.get_screening_criteria_from_user_input(
+            screen_operation=self.screen_operation, records=records
+        )
+        fieldnames = self._get_screening_table_fields(
+            screening_criteria=screening_criteria
+        )
+        rows = self._create_screening_table(
+            records=records, split=split, screening_criteria=screening_criteria
+        )
 
         self.screen_table_path.parents[0].mkdir(parents=True, exist_ok=True)
 
         if export_table_format.lower() == "csv":
-            screen_df = pd.DataFrame(tbl)
-            screen_df.to_csv(self.screen_table_path, index=False, quoting=csv.QUOTE_ALL)
+            # Note: the rows are written as they are created (without a DataFrame)
+            # Like pandas.to_csv(), missing values are empty and lines end with linesep
+            with open(
+                self.screen_table_path, "w", encoding="utf-8", newline=""
+            ) as file:
+                writer = csv.writer(
+                    file, quoting=csv.QUOTE_ALL, lineterminator=os.linesep
+                )
+                writer.writerow(fieldnames)
+                writer.writerows(rows)
             self.review_manager.logger.info(f"Created {self.screen_table_path}")
 
         if export_table_format.lower() == "xlsx":
-            screen_df = pd.DataFrame(tbl)
+            screen_df = pd.DataFrame(list(rows), columns=fieldnames)
             screen_df.to_excel(
                 self.screen_table_path.with_suffix(".xlsx"),
                 index=False,
@@ -176,10 +202,11 @@ class TableScreen(JsonSchemaMixin):
                 record_dict = records[screened_record.get(Fields.ID, "")]
                 record = colrev.record.record.Record(record_dict)
                 if "screen_inclusion" in screened_record:
-                    if screened_record["screen_inclusion"] == "in":
-                        record.set_status(RecordState.rev_included)
-                    elif screened_record["screen_inclusion"] == "out":
-                        record.set_status(RecordState.rev_excluded)
+                    target_state = _SCREEN_DECISIONS.get(
+                        screened_record["screen_inclusion"]
+                    )
+                    if target_state is not None:
+                        record.set_status(target_state)
                     else:
                         print(
                             f"Invalid choice: {screened_record['screen_inclusion']} "
@@ -59,6 +59,7 @@ class UnknownSearchSource(JsonSchemaMixin):
     db_url = ""
 
     HTML_CLEANER = re.compile("<.*?>")
+    YEAR_PATTERN = re.compile(r"\d{4}")
     _padding = 40
 
     def __init__(
@@ -785,7 +786,7 @@ class UnknownSearchSource(JsonSchemaMixin):
         self, *, record: colrev.record.record_prep.PrepRecord
     ) -> None:
         if "date" in record.data and Fields.YEAR not in record.data:
-            year = re.search(r"\d{4}", record.data["date"])
+            year = self.YEAR_PATTERN.search(record.data["date"])
             if year:
                 record.update_field(
                     key=Fields.YEAR,
@@ -11,6 +11,8 @@ import pymupdf
 import requests
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
@@ -46,6 +48,24 @@ class Unpaywall(JsonSchemaMixin):
 
         self.email = self.get_email()
 
+        # Note: the sessions reuse connections (instead of one per request)
+        # and retry server errors (with backoff).
+        # API responses (doi -> url) are cached (the PDFs are not)
+        self.session = requests.Session()
+        self.api_session = self.review_manager.get_cached_session()
+        for session in [self.session, self.api_session]:
+            session.mount(
+                "https://",
+                HTTPAdapter(
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[500, 502, 503, 504],
+                        raise_on_status=False,
+                    )
+                ),
+            )
+
     def get_email(self) -> str:
         """Get user's name and email,
 
@@ -67,23 +87,20 @@ class Unpaywall(JsonSchemaMixin):
         self,
         *,
         doi: str,
-        retry: int = 0,
         pdfonly: bool = True,
     ) -> str:
         url = f"https://api.unpaywall.org/v2/{doi}"
 
         try:
-            ret = requests.get(url, params={"email": self.email}, timeout=30)
-            if ret.status_code == 500 and retry < 3:
-                return self._unpaywall(doi=doi, retry=retry + 1)
-
+            ret = self.api_session.get(url, params={"email": self.email}, timeout=30)
             if ret.status_code in [404, 500]:
                 return "NA"
 
-            best_loc = None
-            best_loc = ret.json()["best_oa_location"]
+            # Note: the response is parsed once (directly from the bytes)
+            data = json.loads(ret.content)
+            best_loc = data["best_oa_location"]
 
-            assert ret.json()["is_oa"]
+            assert data["is_oa"]
             assert best_loc is not None
             assert not (pdfonly and best_loc["url_for_pdf"] is None)
 
@@ -98,6 +115,11 @@ class Unpaywall(JsonSchemaMixin):
         return best_loc["url_for_pdf"]
 
     def _is_pdf(self, *, path_to_file: Path) -> bool:
+        # Note: check the header first (e.g., html pages are not opened with pymupdf)
+        # The PDF header may be preceded by other bytes (within the first 1024 bytes)
+        with open(path_to_file, "rb") as file:
+            if b"%PDF-" not in file.read(1024):
+                return False
         with pymupdf.open(path_to_file) as doc:
             doc.load_page(0).get_text()
         return True
@@ -119,7 +141,7 @@ class Unpaywall(JsonSchemaMixin):
             return record
 
         try:
-            res = requests.get(
+            res = self.session.get(
                 url,
                 headers={
                     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) "
@@ -131,8 +153,10 @@ class Unpaywall(JsonSchemaMixin):
 
             if 200 == res.status_code:
                 pdf_filepath.parents[0].mkdir(exist_ok=True, parents=True)
+                # Note: stream to the file (instead of loading the content in memory)
                 with open(pdf_filepath, "wb") as file:
-                    file.write(res.content)
+                    for chunk in res.iter_content(chunk_size=1 << 16):
+                        file.write(chunk)
                 if self._is_pdf(path_to_file=pdf_filepath):
                     self.review_manager.report_logger.debug(
                         "Retrieved pdf (unpaywall):" f" {pdf_filepath.name}"
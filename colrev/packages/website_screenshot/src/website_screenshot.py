@@ -48,6 +48,9 @@ class WebsiteScreenshot(JsonSchemaMixin):
             imagename=self.CHROME_BROWSERLESS_IMAGE
         )
         pdf_get_operation.docker_images_to_stop.append(self.CHROME_BROWSERLESS_IMAGE)
+        # Note: the session keeps the connection to the local service alive
+        # (the availability check and the screenshot run for every record)
+        self.session = requests.Session()
 
     def _start_screenshot_service(self) -> None:
         """Start the screenshot service"""
@@ -92,7 +95,7 @@ class WebsiteScreenshot(JsonSchemaMixin):
 
         browserless_chrome_available = False
         try:
-            ret = requests.get(
+            ret = self.session.get(
                 "http://127.0.0.1:3000/",
                 headers=content_type_header,
                 timeout=30,
@@ -125,7 +128,7 @@ class WebsiteScreenshot(JsonSchemaMixin):
             },
         }
 
-        ret = requests.post("http://127.0.0.1:3000/pdf", json=json_val, timeout=30)
+        ret = self.session.post("http://127.0.0.1:3000/pdf", json=json_val, timeout=30)
 
         if 200 == ret.status_code:
             with open(pdf_filepath, "wb") as file:
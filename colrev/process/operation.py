@@ -9,7 +9,9 @@ import git
 from docker.errors import DockerException
 
 import colrev.exceptions as colrev_exceptions
+from colrev.constants import Fields
 from colrev.constants import OperationsType
+from colrev.constants import RecordState
 from colrev.process.model import ProcessModel
 
 if typing.TYPE_CHECKING:  # pragma: no cover
@@ -69,6 +71,25 @@ class Operation:
         except DockerException:
             pass
 
+    def _get_nr_tasks_and_pad(
+        self,
+        *,
+        records: typing.Iterable[dict],
+        state: typing.Optional[RecordState] = None,
+        max_pad: int = 40,
+    ) -> typing.Tuple[int, int]:
+        """Get the number of tasks (records in the state) and the ID padding"""
+        nr_tasks = 0
+        max_id_len = -1
+        for record in records:
+            if state is None or state == record[Fields.STATUS]:
+                nr_tasks += 1
+            max_id_len = max(max_id_len, len(record[Fields.ID]))
+        pad = 0
+        if max_id_len >= 0:
+            pad = min((max_id_len + 2), max_pad)
+        return nr_tasks, pad
+
     def _check_model_precondition(self) -> None:
         ProcessModel.check_operation_precondition(self)
 
@@ -2,12 +2,37 @@
 """Checker for erroneous-title-field."""
 from __future__ import annotations
 
+from functools import lru_cache
+
 import colrev.record.qm.quality_model
 from colrev.constants import DefectCodes
 from colrev.constants import Fields
 
 # pylint: disable=too-few-public-methods
 
+# Cover common errors
+_ERRONEOUS_TITLES = {
+    "A I S ssociation for nformation ystems",
+    "The International Journal of Information Systems "
+    + "Applications Chairman of the Editorial Board",
+}
+
+
+# Note: the quality model runs repeatedly on the same titles (e.g., in each prep round)
+@lru_cache(maxsize=4096)
+def _title_has_errors(title: str) -> bool:
+    if title in _ERRONEOUS_TITLES:
+        return True
+
+    # Note: the digits are counted once (map(str.isdigit) runs in C)
+    nr_digits = sum(map(str.isdigit, title))
+    if nr_digits > sum(map(str.isalpha, title)):
+        return True
+
+    if " " not in title and ("_" in title or "." in title or nr_digits > 0):
+        return True
+    return False
+
 
 class ErroneousTitleFieldChecker:
     """The ErroneousTitleFieldChecker"""
@@ -29,32 +54,12 @@ class ErroneousTitleFieldChecker:
         if record.masterdata_is_curated():
             return
 
-        if self._title_has_errors(title=record.data[Fields.TITLE]):
+        if _title_has_errors(record.data[Fields.TITLE]):
             record.add_field_provenance_note(key=Fields.TITLE, note=self.msg)
 
         else:
             record.remove_field_provenance_note(key=Fields.TITLE, note=self.msg)
 
-    def _title_has_errors(self, *, title: str) -> bool:
-        # Cover common errors
-        if title in {
-            "A I S ssociation for nformation ystems",
-            "The International Journal of Information Systems "
-            + "Applications Chairman of the Editorial Board",
-        }:
-            return True
-
-        if sum(char.isdigit() for char in title) > sum(
-            char.isalpha() for char in title
-        ):
-            return True
-
-        if " " not in title and (
-            any(x in title for x in ["_", "."]) or any(char.isdigit() for char in title)
-        ):
-            return True
-        return False
-
 
 def register(quality_model: colrev.record.qm.quality_model.QualityModel) -> None:
     """Register the checker"""
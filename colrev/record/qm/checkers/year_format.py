@@ -17,6 +17,8 @@ class YearFormatChecker:
 
     msg = DefectCodes.YEAR_FORMAT
 
+    _YEAR_REGEX = re.compile(r"^\d{4}$")
+
     def __init__(
         self, quality_model: colrev.record.qm.quality_model.QualityModel
     ) -> None:
@@ -35,7 +37,7 @@ class YearFormatChecker:
         if record.masterdata_is_curated():
             return
 
-        if not re.match(r"^\d{4}$", record.data[Fields.YEAR]):
+        if not self._YEAR_REGEX.match(record.data[Fields.YEAR]):
             record.add_field_provenance_note(key=Fields.YEAR, note=self.msg)
         else:
             record.remove_field_provenance_note(key=Fields.YEAR, note=self.msg)
@@ -228,48 +228,48 @@ def get_colrev_pdf_id(pdf_path: Path, *, cpid_version: str = "cpid2") -> str:
     raise NotImplementedError
 
 
-def get_toc_key(record: colrev.record.record.Record) -> str:
-    """Get the record's toc-key"""
+def get_toc_key_from_dict(record_dict: dict) -> str:
+    """Get the toc-key of a record dict (without creating a Record)"""
 
     try:
-        if record.data[Fields.ENTRYTYPE] == ENTRYTYPES.ARTICLE:
+        if record_dict[Fields.ENTRYTYPE] == ENTRYTYPES.ARTICLE:
             toc_key = (
-                record.data[Fields.JOURNAL]
+                record_dict[Fields.JOURNAL]
                 .replace(" ", "-")
                 .replace("\\", "")
                 .replace("&", "and")
                 .lower()
             )
             toc_key += (
-                f"|{record.data[Fields.VOLUME]}"
+                f"|{record_dict[Fields.VOLUME]}"
                 if (
                     FieldValues.UNKNOWN
-                    != record.data.get(Fields.VOLUME, FieldValues.UNKNOWN)
+                    != record_dict.get(Fields.VOLUME, FieldValues.UNKNOWN)
                 )
                 else "|-"
             )
             toc_key += (
-                f"|{record.data[Fields.NUMBER]}"
+                f"|{record_dict[Fields.NUMBER]}"
                 if (
                     FieldValues.UNKNOWN
-                    != record.data.get(Fields.NUMBER, FieldValues.UNKNOWN)
+                    != record_dict.get(Fields.NUMBER, FieldValues.UNKNOWN)
                 )
                 else "|-"
             )
 
-        elif record.data[Fields.ENTRYTYPE] == ENTRYTYPES.INPROCEEDINGS:
+        elif record_dict[Fields.ENTRYTYPE] == ENTRYTYPES.INPROCEEDINGS:
             toc_key = (
-                record.data[Fields.BOOKTITLE]
+                record_dict[Fields.BOOKTITLE]
                 .replace(" ", "-")
                 .replace("\\", "")
                 .replace("&", "and")
                 .lower()
-                + f"|{record.data.get(Fields.YEAR, '')}"
+                + f"|{record_dict.get(Fields.YEAR, '')}"
             )
         else:
             msg = (
-                f"ENTRYTYPE {record.data[Fields.ENTRYTYPE]} "
-                + f"({record.data[Fields.ID]}) not toc-identifiable"
+                f"ENTRYTYPE {record_dict[Fields.ENTRYTYPE]} "
+                + f"({record_dict[Fields.ID]}) not toc-identifiable"
             )
             raise colrev_exceptions.NotTOCIdentifiableException(msg)
     except KeyError as exc:
@@ -278,3 +278,8 @@ def get_toc_key(record: colrev.record.record.Record) -> str:
         ) from exc
 
     return toc_key
+
+
+def get_toc_key(record: colrev.record.record.Record) -> str:
+    """Get the record's toc-key"""
+    return get_toc_key_from_dict(record.data)
@@ -203,9 +203,7 @@ def _get_similarity_detailed(record_a: dict, record_b: dict) -> float:
     return round(weighted_average, 4)
 
 
-def _ensure_mandatory_fields(
-    record_a: colrev.record.record.Record, record_b: colrev.record.record.Record
-) -> None:
+def _ensure_mandatory_fields(record: colrev.record.record.Record) -> None:
     mandatory_fields = [
         Fields.TITLE,
         Fields.AUTHOR,
@@ -218,16 +216,16 @@ def _ensure_mandatory_fields(
     ]
 
     for mandatory_field in mandatory_fields:
-        if (
-            record_a.data.get(mandatory_field, FieldValues.UNKNOWN)
-            == FieldValues.UNKNOWN
-        ):
-            record_a.data[mandatory_field] = ""
-        if (
-            record_b.data.get(mandatory_field, FieldValues.UNKNOWN)
-            == FieldValues.UNKNOWN
-        ):
-            record_b.data[mandatory_field] = ""
+        if record.data.get(mandatory_field, FieldValues.UNKNOWN) == FieldValues.UNKNOWN:
+            record.data[mandatory_field] = ""
+
+
+def _prepare_for_similarity(record: colrev.record.record.Record) -> dict:
+    record = record.copy()
+    _ensure_mandatory_fields(record)
+    _abbreviate_container_title(record)
+    _format_authors_string_for_comparison(record)
+    return record.get_data()
 
 
 def get_record_similarity(
@@ -235,17 +233,40 @@ def get_record_similarity(
 ) -> float:
     """Determine the similarity between two records (their masterdata)"""
 
-    record_a = record_a.copy()
-    record_b = record_b.copy()
+    return _get_similarity_detailed(
+        _prepare_for_similarity(record_a), _prepare_for_similarity(record_b)
+    )
+
+
+def get_record_similarities(
+    record: colrev.record.record.Record,
+    candidates: typing.List[colrev.record.record.Record],
+) -> typing.List[float]:
+    """Determine the similarities between a record and a list of candidates
+    (the record is prepared once for all candidates)"""
+
+    return get_prepared_record_similarities(record, prepare_for_similarity(candidates))
 
-    _ensure_mandatory_fields(record_a, record_b)
 
-    _abbreviate_container_title(record_a)
-    _abbreviate_container_title(record_b)
-    _format_authors_string_for_comparison(record_a)
-    _format_authors_string_for_comparison(record_b)
+def prepare_for_similarity(
+    records: typing.List[colrev.record.record.Record],
+) -> typing.List[dict]:
+    """Prepare records for (repeated) similarity comparisons"""
+    return [_prepare_for_similarity(record) for record in records]
 
-    return _get_similarity_detailed(record_a.get_data(), record_b.get_data())
+
+def get_prepared_record_similarities(
+    record: colrev.record.record.Record,
+    prepared_candidates: typing.List[dict],
+) -> typing.List[float]:
+    """Determine the similarities between a record and prepared candidates
+    (see prepare_for_similarity)"""
+
+    record_dict = _prepare_for_similarity(record)
+    return [
+        _get_similarity_detailed(candidate_dict, record_dict)
+        for candidate_dict in prepared_candidates
+    ]
 
 
 def matches(
@@ -5,6 +5,7 @@ from __future__ import annotations
 import dataclasses
 import json
 import typing
+from collections import Counter
 from dataclasses import asdict
 from dataclasses import dataclass
 from enum import Enum
@@ -409,12 +410,10 @@ class Settings(JsonSchemaMixin):
     def is_curated_repo(self) -> bool:
         """Check whether data is curated in this repository"""
 
-        curation_endpoints = [
-            x
+        return any(
+            x["endpoint"] == "colrev.colrev_curation"
             for x in self.data.data_package_endpoints
-            if x["endpoint"] == "colrev.colrev_curation"
-        ]
-        return bool(curation_endpoints)
+        )
 
     def is_curated_masterdata_repo(self) -> bool:
         """Check whether the masterdata is curated in this repository"""
@@ -478,7 +477,10 @@ def _load_settings_from_dict(*, loaded_dict: dict) -> Settings:
 
         filenames = [x.filename for x in settings.sources]
         if not len(filenames) == len(set(filenames)):
-            non_unique = list({str(x) for x in filenames if filenames.count(x) > 1})
+            # Note: Counter avoids a count() scan per filename (quadratic)
+            non_unique = list(
+                {str(x) for x, count in Counter(filenames).items() if count > 1}
+            )
             msg = f"Non-unique source filename(s): {', '.join(non_unique)}"
             raise colrev_exceptions.InvalidSettingsError(msg=msg, fix_per_upgrade=False)
 
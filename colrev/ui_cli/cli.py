@@ -1021,13 +1021,14 @@ def dedupe(
 )
 @click.option(
     "--export_format",
-    type=click.Choice(["CSV", "XLSX"], case_sensitive=False),
+    type=click.Choice(["CSV", "XLSX", "FEATHER", "PARQUET"], case_sensitive=False),
     help="Export table with the screening decisions",
 )
 @click.option(
     "--import_table",
     type=click.Path(exists=True),
-    help="Import file with the screening decisions (csv/xlsx supported)",
+    help="Import file with the screening decisions "
+    "(csv/xlsx/feather/parquet supported)",
 )
 @click.option(
     "--create_split",
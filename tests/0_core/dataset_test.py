@@ -141,6 +141,45 @@ def test_propagated_id(
     base_repo_review_manager.dataset.load_records_dict = original_load_records_dict  # type: ignore
 
 
+def test_read_next_record_conditions_changed_by_consumer(
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test that records are yielded once even if the consumer changes them."""
+    original_load_records_dict = base_repo_review_manager.dataset.load_records_dict
+
+    base_repo_review_manager.dataset.load_records_dict = MagicMock(  # type: ignore
+        return_value={
+            "Doe2021": {
+                "ID": "Doe2021",
+                "colrev_status": RecordState.rev_prescreen_included,
+            },
+            "Smith2022": {
+                "ID": "Smith2022",
+                "colrev_status": RecordState.md_imported,
+            },
+            "Johnson2023": {
+                "ID": "Johnson2023",
+                "colrev_status": RecordState.pdf_needs_manual_retrieval,
+            },
+        }
+    )
+
+    yielded_ids = []
+    for record_dict in base_repo_review_manager.dataset.read_next_record(
+        conditions=[
+            {"colrev_status": RecordState.rev_prescreen_included},
+            {"colrev_status": RecordState.pdf_needs_manual_retrieval},
+        ]
+    ):
+        yielded_ids.append(record_dict["ID"])
+        # e.g., a failed retrieval in pdf-get
+        record_dict["colrev_status"] = RecordState.pdf_needs_manual_retrieval
+
+    assert yielded_ids == ["Doe2021", "Johnson2023"]
+
+    base_repo_review_manager.dataset.load_records_dict = original_load_records_dict  # type: ignore
+
+
 def test_get_format_report(
     base_repo_review_manager: colrev.review_manager.ReviewManager,
 ) -> None:
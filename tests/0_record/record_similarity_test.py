@@ -81,3 +81,60 @@ def test_matches(input_dict_1: dict, input_dict_2: dict, matches: bool) -> None:
     record1 = colrev.record.record_prep.PrepRecord(input_dict_1)
     record2 = colrev.record.record_prep.PrepRecord(input_dict_2)
     assert colrev.record.record_similarity.matches(record1, record2) == matches
+
+
+def test_get_record_similarities() -> None:
+    """Test get_record_similarities() (corresponds to get_record_similarity())"""
+    record = colrev.record.record.Record(
+        {
+            Fields.ID: "r1",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.YEAR: "2020",
+            Fields.TITLE: "EDITORIAL",
+            Fields.AUTHOR: "Rai, Arun",
+            Fields.JOURNAL: "MIS Quarterly",
+            Fields.VOLUME: "45",
+            Fields.NUMBER: "1",
+        }
+    )
+    candidates = [
+        colrev.record.record.Record(
+            {
+                Fields.ID: "r2",
+                Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+                Fields.YEAR: "2020",
+                Fields.TITLE: "EDITORIAL",
+                Fields.AUTHOR: "Rai, A",
+                Fields.JOURNAL: "MISQ",
+                Fields.VOLUME: "45",
+                Fields.NUMBER: "1",
+            }
+        ),
+        colrev.record.record.Record(
+            {
+                Fields.ID: "r3",
+                Fields.ENTRYTYPE: ENTRYTYPES.INPROCEEDINGS,
+                Fields.YEAR: "2021",
+                Fields.TITLE: "A different paper",
+                Fields.AUTHOR: "Webster, Jane",
+                Fields.BOOKTITLE: "ICIS",
+            }
+        ),
+    ]
+    expected = [
+        colrev.record.record_similarity.get_record_similarity(candidate, record)
+        for candidate in candidates
+    ]
+    actual = colrev.record.record_similarity.get_record_similarities(record, candidates)
+    assert expected == actual
+    assert record.data[Fields.AUTHOR] == "Rai, Arun"
+
+    prepared_candidates = colrev.record.record_similarity.prepare_for_similarity(
+        candidates
+    )
+    assert (
+        colrev.record.record_similarity.get_prepared_record_similarities(
+            record, prepared_candidates
+        )
+        == expected
+    )
@@ -2,12 +2,15 @@
 """Testing environment manager settings"""
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 import colrev.env.tei_parser
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import RecordState
 
 
 def test_get_template() -> None:
@@ -44,9 +47,48 @@ def test_inplace_change() -> None:
         assert file.read() == "Another content."
 
 
+def test_inplace_change_multiple() -> None:
+    with open("temp.txt", "w") as file:
+        file.write("{a.pdf} {b.pdf} {ab.pdf}")
+
+    # Note: replacements are not applied to replaced strings (one pass)
+    colrev.env.utils.inplace_change_multiple(
+        filename=Path("temp.txt"),
+        replacements={"{a.pdf}": "{b.pdf}", "{b.pdf}": "{c.pdf}", "{ab.pdf}": "{d}"},
+    )
+
+    with open("temp.txt") as file:
+        assert file.read() == "{b.pdf} {c.pdf} {d}"
+
+    colrev.env.utils.inplace_change_multiple(filename=Path("temp.txt"), replacements={})
+
+    with open("temp.txt") as file:
+        assert file.read() == "{b.pdf} {c.pdf} {d}"
+
+
 def test_remove_accents() -> None:
 
     assert colrev.env.utils.remove_accents("éàèùç") == "eaeuc"
     assert colrev.env.utils.remove_accents("Á") == "A"
     assert colrev.env.utils.remove_accents("Paré") == "Pare"
     assert colrev.env.utils.remove_accents("Müller") == "Muller"
+
+
+def test_save_df_to_xlsx(tmp_path) -> None:  # type: ignore
+    data_frame = pd.DataFrame(
+        {
+            Fields.ID: ["Doe2021", "Smith2022"],
+            Fields.YEAR: [2021, None],
+            Fields.STATUS: [RecordState.md_prepared, RecordState.md_imported],
+        }
+    )
+    path = tmp_path / Path("test.xlsx")
+    colrev.env.utils.save_df_to_xlsx(
+        data_frame=data_frame, path=path, sheet_name="screen"
+    )
+
+    loaded_df = pd.read_excel(path, sheet_name="screen")
+    assert loaded_df[Fields.ID].tolist() == ["Doe2021", "Smith2022"]
+    assert loaded_df[Fields.YEAR].tolist()[0] == 2021
+    assert pd.isna(loaded_df[Fields.YEAR].tolist()[1])
+    assert loaded_df[Fields.STATUS].tolist() == ["md_prepared", "md_imported"]
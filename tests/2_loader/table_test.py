@@ -1,11 +1,15 @@
 #!/usr/bin/env python
 """Tests of the load utils for bib files"""
+import datetime
 import os
 from pathlib import Path
 
+import openpyxl
+import pandas as pd
 import pytest
 
 import colrev.loader.load_utils
+import colrev.loader.table
 from colrev.constants import Fields
 
 
@@ -99,3 +103,71 @@ def test_load(tmp_path, helpers) -> None:  # type: ignore
 
     nr_records = colrev.loader.load_utils.get_nr_records(Path("xlsx_data.xlsx"))
     assert 3 == nr_records
+
+
+def _create_xlsx(path: Path, rows: list, *, blank_rows: int = 0) -> None:
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    for row in rows:
+        worksheet.append(row)
+    for row_nr in range(len(rows) + 1, len(rows) + 1 + blank_rows):
+        # Note: styled cells without values are read as blank rows
+        worksheet.cell(row=row_nr, column=1).font = openpyxl.styles.Font(bold=True)
+    workbook.save(path)
+
+
+def _without_nan(records_list: list) -> list:
+    return [
+        {key: None if pd.isna(value) else value for key, value in record.items()}
+        for record in records_list
+    ]
+
+
+@pytest.mark.parametrize(
+    "rows, blank_rows, streamed",
+    [
+        # integral and non-integral floats
+        ([["ID", "year", "value"], ["1", 2021.0, 1.5], ["2", 3.0, 0.1]], 0, True),
+        # datetime and bool cells
+        (
+            [
+                ["ID", "date", "flag"],
+                ["1", datetime.datetime(2021, 3, 4, 5, 6, 7), True],
+                ["2", datetime.datetime(2022, 1, 1), False],
+            ],
+            0,
+            True,
+        ),
+        # empty cells (and empty trailing header cells)
+        ([["ID", "title", None], ["1", None], ["2", "", None], [None, "T"]], 0, True),
+        # trailing blank rows
+        ([["ID", "title"], ["1", "A"], ["2", "B"]], 3, True),
+        # fallback: non-string column name
+        ([["ID", 2021], ["1", "A"]], 0, False),
+        # fallback: missing column name (followed by another column)
+        ([["ID", None, "title"], ["1", "A", "B"]], 0, False),
+        # fallback: duplicate column names
+        ([["ID", "title", "title"], ["1", "A", "B"]], 0, False),
+        # fallback: values outside the header columns
+        ([["ID", "title"], ["1", "A", "extra"]], 0, False),
+    ],
+)
+def test_load_xlsx_records_list(  # type: ignore
+    tmp_path, rows: list, blank_rows: int, streamed: bool
+) -> None:
+    """Test that the xlsx records match pd.read_excel(dtype=str)"""
+
+    path = tmp_path / "table.xlsx"
+    _create_xlsx(path, rows, blank_rows=blank_rows)
+    table_loader = colrev.loader.table.TableLoader(
+        filename=path,
+        entrytype_setter=lambda x: x,
+        field_mapper=lambda x: x,
+        id_labeler=lambda x: x,
+        unique_id_field="INCREMENTAL",
+    )
+
+    # pylint: disable=protected-access
+    assert (table_loader._load_xlsx_records_list() is not None) == streamed
+    expected = pd.read_excel(path, dtype=str).to_dict("records")
+    assert _without_nan(table_loader.load_records_list()) == _without_nan(expected)
@@ -2,6 +2,7 @@
 """Tests of the CoLRev screen operation"""
 import pytest
 
+import colrev.ops.custom_scripts.custom_screen_script
 import colrev.review_manager
 from colrev.constants import Fields
 from colrev.constants import RecordState
@@ -34,6 +35,41 @@ def test_screen(  # type: ignore
     helpers.reset_commit(base_repo_review_manager, commit="screen_commit")
 
 
+def test_custom_screen_script(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test that the custom screen script saves the decisions"""
+
+    helpers.reset_commit(base_repo_review_manager, commit="screen_commit")
+    screen_operation = base_repo_review_manager.get_screen_operation()
+    records = base_repo_review_manager.dataset.load_records_dict()
+    for record_dict in records.values():
+        # pylint: disable=colrev-direct-status-assign
+        record_dict[Fields.STATUS] = RecordState.pdf_prepared
+    base_repo_review_manager.dataset.save_records_dict(records)
+    screened_ids = [r[Fields.ID] for r in screen_operation.get_data()["items"]]
+    assert screened_ids
+
+    custom_screen = colrev.ops.custom_scripts.custom_screen_script.CustomScreen(
+        screen_operation=screen_operation,
+        settings={"endpoint": "custom_screen_script"},
+    )
+    custom_screen.run_screen(screen_operation, records, [])
+    decisions = {
+        record_id: records[record_id][Fields.STATUS] for record_id in screened_ids
+    }
+    assert set(decisions.values()) <= {
+        RecordState.rev_included,
+        RecordState.rev_excluded,
+    }
+
+    records = base_repo_review_manager.dataset.load_records_dict()
+    for record_id, status in decisions.items():
+        assert records[record_id][Fields.STATUS] == status
+
+    helpers.reset_commit(base_repo_review_manager, commit="screen_commit")
+
+
 def test_add_criterion(  # type: ignore
     base_repo_review_manager: colrev.review_manager.ReviewManager, criterion
 ) -> None:
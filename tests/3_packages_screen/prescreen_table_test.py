@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""Test the prescreen_table package"""
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import colrev.exceptions as colrev_exceptions
+import colrev.packages.prescreen_table.src.prescreen_table
+import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import RecordState
+
+TablePrescreen = colrev.packages.prescreen_table.src.prescreen_table.TablePrescreen
+
+
+@pytest.fixture(name="table_prescreen")
+def fixture_table_prescreen(
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> TablePrescreen:
+    """Fixture returning a TablePrescreen instance (exporting to tmp_path)"""
+    monkeypatch.chdir(tmp_path)
+    prescreen_operation = base_repo_review_manager.get_prescreen_operation(
+        notify_state_transition_operation=False
+    )
+    return TablePrescreen(
+        prescreen_operation=prescreen_operation,
+        settings={"endpoint": "colrev.prescreen_table"},
+    )
+
+
+def _get_records() -> dict:
+    return {
+        "Doe2021": {
+            Fields.ID: "Doe2021",
+            Fields.STATUS: RecordState.md_processed,
+            Fields.TITLE: "A first title",
+        },
+        "Smith2022": {
+            Fields.ID: "Smith2022",
+            Fields.STATUS: RecordState.md_processed,
+            Fields.TITLE: "A second title",
+        },
+    }
+
+
+@pytest.mark.parametrize("export_table_format", ["feather", "parquet"])
+def test_export_import_table_pyarrow(  # type: ignore
+    table_prescreen: TablePrescreen, export_table_format: str, mocker
+) -> None:
+    """Test the round trip of feather/parquet prescreen tables"""
+    pytest.importorskip("pyarrow")
+    records = _get_records()
+
+    table_prescreen.export_table(
+        records=records, split=[], export_table_format=export_table_format
+    )
+
+    table_path = f"prescreen.{export_table_format}"
+    if export_table_format == "feather":
+        prescreen_df = pd.read_feather(table_path)
+    else:
+        prescreen_df = pd.read_parquet(table_path)
+    assert list(prescreen_df[Fields.ID]) == ["Doe2021", "Smith2022"]
+    assert list(prescreen_df["presceen_inclusion"]) == ["TODO", "TODO"]
+
+    prescreen_df["presceen_inclusion"] = ["in", "out"]
+    if export_table_format == "feather":
+        prescreen_df.to_feather(table_path)
+    else:
+        prescreen_df.to_parquet(table_path, index=False)
+
+    mocker.patch.object(table_prescreen.review_manager.dataset, "save_records_dict")
+    table_prescreen.import_table(records=records, import_table_path=table_path)
+
+    assert records["Doe2021"][Fields.STATUS] == RecordState.rev_prescreen_included
+    assert records["Smith2022"][Fields.STATUS] == RecordState.rev_prescreen_excluded
+
+
+def test_export_table_csv_pyarrow(
+    table_prescreen: TablePrescreen, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the pyarrow csv export matches the pandas export"""
+    pytest.importorskip("pyarrow")
+    records = _get_records()
+    records["Doe2021"][Fields.AUTHOR] = 'Doe, "Jane"'
+    records["Smith2022"][Fields.TITLE] = "A second title,\nwith a line break"
+
+    table_prescreen.export_table(records=records, split=[])
+    pyarrow_csv = Path("prescreen.csv").read_bytes()
+
+    monkeypatch.setattr(colrev.packages.prescreen_table.src.prescreen_table, "pa", None)
+    table_prescreen.export_table(records=records, split=[])
+    pandas_csv = Path("prescreen.csv").read_bytes()
+
+    assert pyarrow_csv == pandas_csv
+
+
+def test_pyarrow_missing(
+    table_prescreen: TablePrescreen, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the feather/parquet tables without pyarrow"""
+    monkeypatch.setattr(colrev.packages.prescreen_table.src.prescreen_table, "pa", None)
+
+    with pytest.raises(colrev_exceptions.MissingDependencyError):
+        table_prescreen.export_table(
+            records=_get_records(), split=[], export_table_format="feather"
+        )
+
+    Path("prescreen.parquet").touch()
+    with pytest.raises(colrev_exceptions.MissingDependencyError):
+        table_prescreen.import_table(
+            records=_get_records(), import_table_path="prescreen.parquet"
+        )
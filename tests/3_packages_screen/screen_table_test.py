@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Test the screen_table package"""
+import csv
+from pathlib import Path
+
+import pytest
+
+import colrev.packages.screen_table.src.screen_table
+import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import RecordState
+
+TableScreen = colrev.packages.screen_table.src.screen_table.TableScreen
+
+
+@pytest.fixture(name="table_screen")
+def fixture_table_screen(
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> TableScreen:
+    """Fixture returning a TableScreen instance (exporting to tmp_path)"""
+    monkeypatch.chdir(tmp_path)
+    screen_operation = base_repo_review_manager.get_screen_operation()
+    return TableScreen(
+        screen_operation=screen_operation,
+        settings={"endpoint": "colrev.screen_table"},
+    )
+
+
+def _get_records() -> dict:
+    return {
+        "Doe2021": {
+            Fields.ID: "Doe2021",
+            Fields.STATUS: RecordState.pdf_prepared,
+            Fields.TITLE: "A first title",
+            Fields.SCREENING_CRITERIA: "c1=in;c2=out",
+        },
+        "Smith2022": {
+            Fields.ID: "Smith2022",
+            Fields.STATUS: RecordState.pdf_prepared,
+            Fields.TITLE: "A second title",
+        },
+        "Johnson2023": {
+            Fields.ID: "Johnson2023",
+            Fields.STATUS: RecordState.rev_included,
+            Fields.TITLE: "A third title",
+        },
+    }
+
+
+def _read_rows() -> list:
+    with open(TableScreen.screen_table_path, encoding="utf-8", newline="") as file:
+        return list(csv.DictReader(file))
+
+
+def test_export_table_screening_criteria(  # type: ignore
+    table_screen: TableScreen, mocker
+) -> None:
+    """Test the export of records with (existing) screening criteria"""
+    mocker.patch(
+        "colrev.packages.screen_utils.get_screening_criteria_from_user_input",
+        return_value={"c1": "criterion 1", "c2": "criterion 2"},
+    )
+
+    table_screen.export_table(records=_get_records(), split=[])
+
+    rows = _read_rows()
+    assert list(rows[0]) == [
+        Fields.ID,
+        Fields.AUTHOR,
+        Fields.TITLE,
+        Fields.JOURNAL,
+        Fields.BOOKTITLE,
+        Fields.YEAR,
+        Fields.VOLUME,
+        Fields.NUMBER,
+        Fields.PAGES,
+        Fields.DOI,
+        Fields.ABSTRACT,
+        "c1",
+        "c2",
+    ]
+    assert [row[Fields.ID] for row in rows] == ["Doe2021", "Smith2022"]
+    assert rows[0][Fields.TITLE] == "A first title"
+    assert rows[0][Fields.AUTHOR] == ""
+    assert (rows[0]["c1"], rows[0]["c2"]) == ("in", "out")
+    assert (rows[1]["c1"], rows[1]["c2"]) == ("TODO (in/out)", "TODO (in/out)")
+
+
+def test_export_table_screen_inclusion(  # type: ignore
+    table_screen: TableScreen, mocker
+) -> None:
+    """Test the export of records without screening criteria"""
+    mocker.patch(
+        "colrev.packages.screen_utils.get_screening_criteria_from_user_input",
+        return_value={},
+    )
+    table_screen.export_todos_only = False
+
+    table_screen.export_table(records=_get_records(), split=["Doe2021", "Johnson2023"])
+
+    rows = _read_rows()
+    assert list(rows[0])[-1] == "screen_inclusion"
+    assert [(row[Fields.ID], row["screen_inclusion"]) for row in rows] == [
+        ("Doe2021", "TODO"),
+        ("Johnson2023", "in"),
+    ]
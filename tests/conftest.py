@@ -2,6 +2,7 @@
 """Conftest file containing fixtures to set up tests efficiently"""
 from __future__ import annotations
 
+import logging
 import os
 import shutil
 import typing
@@ -97,6 +98,50 @@ def run_around_tests(  # type: ignore
     helpers.reset_commit(base_repo_review_manager, commit="data_commit")
 
 
+def _load_test_records(
+    test_data_path: Path, *, logger: logging.Logger = logging.getLogger(__name__)
+) -> typing.Dict[Path, dict]:
+    """Load the test records (bib files) for the local_index"""
+    bib_files_to_index = test_data_path / Path("data/local_index")
+    return {
+        Path(file_path.name): colrev.loader.load_utils.load(
+            filename=file_path,
+            logger=logger,
+            unique_id_field="ID",
+        )
+        for file_path in bib_files_to_index.glob("**/*")
+    }
+
+
+def _index_test_records(
+    local_index_builder: colrev.env.local_index_builder.LocalIndexBuilder,
+    test_records_dict: typing.Dict[Path, dict],
+) -> None:
+    """Index the test records (curated masterdata before the curation layer)"""
+    # Note: the files are partitioned once (the curation layer amends records
+    # that must already be in the index)
+    curation_layers = [path for path in test_records_dict if "cura" in str(path)]
+    for path, records in test_records_dict.items():
+        if path in curation_layers:
+            continue
+        local_index_builder.index_records(
+            records=records,
+            repo_source_path=path,
+            curated_fields=[],
+            curation_url="gh...",
+            curated_masterdata=True,
+        )
+
+    for path in curation_layers:
+        local_index_builder.index_records(
+            records=test_records_dict[path],
+            repo_source_path=path,
+            curated_fields=["literature_review"],
+            curation_url="gh...",
+            curated_masterdata=False,
+        )
+
+
 @pytest.fixture(scope="session", name="test_local_index_dir")
 def get_test_local_index_dir(tmp_path_factory):  # type: ignore
     """Fixture returning the test_local_index_dir"""
@@ -138,52 +183,19 @@ def fixture_base_repo_review_manager(session_mocker, tmp_path_factory, helpers):
         git_repo.config_writer().set_value("user", "name", "Tester").release()
         git_repo.config_writer().set_value("user", "email", "tester@mail.com").release()
 
-    def load_test_records(test_data_path) -> dict:  # type: ignore
-        test_records_dict: typing.Dict[Path, dict] = {}
-        bib_files_to_index = test_data_path / Path("data/local_index")
-        for file_path in bib_files_to_index.glob("**/*"):
-            test_records_dict[Path(file_path.name)] = {}
-
-        for path in test_records_dict:
-            test_records_dict[path] = colrev.loader.load_utils.load(
-                filename=bib_files_to_index.joinpath(path),
-                logger=review_manager.logger,
-                unique_id_field="ID",
-            )
-
-        return test_records_dict
-
     temp_sqlite = review_manager.path.parent / Path("sqlite_index_test.db")
     with session_mocker.patch.object(
         colrev.constants.Filepaths, "LOCAL_INDEX_SQLITE_FILE", temp_sqlite
     ):
-        test_records_dict = load_test_records(helpers.test_data_path)
+        test_records_dict = _load_test_records(
+            helpers.test_data_path, logger=review_manager.logger
+        )
         local_index_builder = colrev.env.local_index_builder.LocalIndexBuilder(
             verbose_mode=True
         )
         local_index_builder.reinitialize_sqlite_db()
 
-        for path, records in test_records_dict.items():
-            if "cura" in str(path):
-                continue
-            local_index_builder.index_records(
-                records=records,
-                repo_source_path=path,
-                curated_fields=[],
-                curation_url="gh...",
-                curated_masterdata=True,
-            )
-
-        for path, records in test_records_dict.items():
-            if "cura" not in str(path):
-                continue
-            local_index_builder.index_records(
-                records=records,
-                repo_source_path=path,
-                curated_fields=["literature_review"],
-                curation_url="gh...",
-                curated_masterdata=False,
-            )
+        _index_test_records(local_index_builder, test_records_dict)
 
     dedupe_operation = review_manager.get_dedupe_operation()
     dedupe_operation.review_manager.settings.project.delay_automated_processing = True
@@ -330,17 +342,8 @@ def get_local_index_test_records_dict(  # type: ignore
     test_local_index_dir,
 ) -> dict:
     """Test records dict for local_index"""
-    local_index_test_records_dict: typing.Dict[Path, dict] = {}
-    bib_files_to_index = helpers.test_data_path / Path("data/local_index")
-    for file_path in bib_files_to_index.glob("**/*"):
-        local_index_test_records_dict[Path(file_path.name)] = {}
-
-    for path in local_index_test_records_dict:
-        loaded_records = colrev.loader.load_utils.load(
-            filename=bib_files_to_index.joinpath(path),
-            unique_id_field="ID",
-        )
-
+    local_index_test_records_dict = _load_test_records(helpers.test_data_path)
+    for loaded_records in local_index_test_records_dict.values():
         # Note : we only select one example for the TEI-indexing
         for loaded_record in loaded_records.values():
             if Fields.FILE not in loaded_record:
@@ -353,8 +356,6 @@ def get_local_index_test_records_dict(  # type: ignore
                     test_local_index_dir / Path(loaded_record[Fields.FILE])
                 )
 
-        local_index_test_records_dict[path] = loaded_records
-
     return local_index_test_records_dict
 
 
@@ -390,27 +391,7 @@ def get_local_index(  # type: ignore
     )
     local_index_builder.reinitialize_sqlite_db()
 
-    for path, records in local_index_test_records_dict.items():
-        if "cura" in str(path):
-            continue
-        local_index_builder.index_records(
-            records=records,
-            repo_source_path=path,
-            curated_fields=[],
-            curation_url="gh...",
-            curated_masterdata=True,
-        )
-
-    for path, records in local_index_test_records_dict.items():
-        if "cura" not in str(path):
-            continue
-        local_index_builder.index_records(
-            records=records,
-            repo_source_path=path,
-            curated_fields=["literature_review"],
-            curation_url="gh...",
-            curated_masterdata=False,
-        )
+    _index_test_records(local_index_builder, local_index_test_records_dict)
 
     local_index = colrev.env.local_index.LocalIndex()
 